@@ -41,7 +41,8 @@ def main() -> Tuple[str, bool]:
                 #path_rsc=path_rsc,
                 global_execute=False, 
                 onefile=True, 
-                console=False
+                console=False,
+                clean=True # full rebuild as before; onefile and clean are no longer the defaults
             )
         else:
             _success: bool = False
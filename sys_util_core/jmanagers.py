@@ -11,7 +11,7 @@ from tkinter import filedialog
 from tkinter.ttk import Progressbar, Treeview
 
 from sys_util_core.jcommon import SingletonBase
-from sys_util_core.jsystems import JErrorSystem, JLogger, JTracer, ThreadPoolSystem
+from sys_util_core.jsystems import JErrorSystem, JLogger, JTracer, ThreadPoolSystem, FileSystem
 
 """
 """
@@ -79,7 +79,7 @@ class SystemManager(SingletonBase):
             is_admin_current = os.getuid() == 0
         elif os.name == 'nt':  # Windows
             is_window = True
-            is_admin_current = ctypes.windll.shell32.IsUserAnAdmin() != 0
+            is_admin_current = FileSystem.is_admin()
         else:
             is_window = False
             is_admin_current = False
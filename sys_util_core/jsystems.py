@@ -15,13 +15,19 @@ import glob
 import hashlib
 import stat
 import tempfile
+import ssl
 import urllib.request
+import urllib.error
+import http.client
 import shlex
 import re, inspect
 import logging, time
 import atexit
+import importlib, importlib.metadata, importlib.util
 import threading
-from concurrent.futures import Future
+from collections import deque
+from itertools import chain
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import IntEnum
 
 from datetime import datetime
@@ -32,6 +38,11 @@ from dataclasses import dataclass
 from sys_util_core.jcommon import SingletonBase
 from sys_util_core.jutils import TextUtils
 
+# Platform constants, fixed for the process lifetime
+_IS_WIN: bool = sys.platform == 'win32'
+_EXE_SUFFIX: str = '.exe' if _IS_WIN else ''
+_PATHSEP: str = os.pathsep
+
 
 class JErrorSystem(Exception):
         """Base exception class for JErrorSystem."""
@@ -514,6 +525,8 @@ class CmdSystem:
         def is_error(self) -> bool:
             return self.returncode != CmdSystem.ReturnCode.SUCCESS
 
+    _QUIET_TAIL_LINES = 200 # stderr lines kept from a failed quiet run
+
     def run(
             cmd: Union[str, List[str]],
             raise_err: bool = True,
@@ -522,27 +535,52 @@ class CmdSystem:
             timeout: Optional[int] = None,
             specific_working_dir: Optional[str] = None,
             cumstem_env: Optional[Dict[str, str]] = None,
-            encoding: Optional[str] = None
+            encoding: Optional[str] = None,
+            quiet: bool = False
         ) -> Result:
         try:
-            JLogger().log_info(f"| cmd.exe | {' '.join(cmd) if isinstance(cmd, list) else cmd}", f_back)
+            # Joining a long argv is skipped unless INFO records are actually emitted
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                JLogger().log_info(f"| cmd.exe | {' '.join(cmd) if isinstance(cmd, list) else cmd}", f_back)
             sentense_or_list = isinstance(cmd, str)
-            cmd_ret: CmdSystem.Result = subprocess.run(
-                cmd,
-                input=stdin,
-                timeout=timeout,
-                shell=sentense_or_list,
-                cwd=specific_working_dir, # Working directory
-                env=cumstem_env, # Environment variables or path
-                capture_output=True, # Capture stdout and stderr
-                text=True, # Decode output as string (UTF-8)
-                check=False, # fail safe
-                errors='replace', # Prevent UnicodeDecodeError
-                encoding=encoding # Custom encoding
-            )
-            ret_code = cmd_ret.returncode
-            ret_out = cmd_ret.stdout.strip() if cmd_ret.stdout else ""
-            ret_err = cmd_ret.stderr.strip() if cmd_ret.stderr else ""
+            if quiet:
+                # Success-only call: drop stdout, spool stderr to a temp file and decode it only on failure
+                with tempfile.TemporaryFile() as err_file:
+                    proc = subprocess.run(
+                        cmd,
+                        input=stdin.encode(encoding or 'utf-8') if stdin is not None else None,
+                        timeout=timeout,
+                        shell=sentense_or_list,
+                        cwd=specific_working_dir,
+                        env=cumstem_env,
+                        stdout=subprocess.DEVNULL,
+                        stderr=err_file,
+                        check=False
+                    )
+                    ret_code = proc.returncode
+                    ret_out = ""
+                    ret_err = ""
+                    if ret_code != CmdSystem.ReturnCode.SUCCESS:
+                        # Keep only the tail, a failed PyInstaller build can log tens of MB
+                        err_file.seek(0)
+                        ret_err = b''.join(deque(err_file, maxlen=CmdSystem._QUIET_TAIL_LINES)).decode(encoding or 'utf-8', errors='replace').strip()
+            else:
+                cmd_ret: CmdSystem.Result = subprocess.run(
+                    cmd,
+                    input=stdin,
+                    timeout=timeout,
+                    shell=sentense_or_list,
+                    cwd=specific_working_dir, # Working directory
+                    env=cumstem_env, # Environment variables or path
+                    capture_output=True, # Capture stdout and stderr
+                    text=True, # Decode output as string (UTF-8)
+                    check=False, # fail safe
+                    errors='replace', # Prevent UnicodeDecodeError
+                    encoding=encoding # Custom encoding
+                )
+                ret_code = cmd_ret.returncode
+                ret_out = cmd_ret.stdout.strip() if cmd_ret.stdout else ""
+                ret_err = cmd_ret.stderr.strip() if cmd_ret.stderr else ""
         except subprocess.CalledProcessError as e:
             ret_code = e.returncode
             ret_out = e.stdout.strip() if e.stdout else ""
@@ -583,13 +621,15 @@ class CmdSystem:
     @param	shell	Whether to execute through shell 셸을 통해 실행할지 여부
     @param	cwd	    Working directory 작업 디렉토리
     @param	env	    Environment variables 환경 변수
+    @param	encoding	Output encoding, None for the locale default 출력 인코딩, None이면 로케일 기본값
     @yields Line-by-line output from the command 명령어의 줄 단위 출력
     """
     def run_streaming(
             cmd: Union[str, List[str]],
             shell: bool = False,
             specific_working_dir: Optional[str] = None,
-            env: Optional[Dict[str, str]] = None
+            env: Optional[Dict[str, str]] = None,
+            encoding: Optional[str] = None
         ):
         if isinstance(cmd, str) and not shell:
             cmd = shlex.split(cmd)
@@ -600,15 +640,75 @@ class CmdSystem:
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
+            encoding=encoding,
+            errors='replace', # a stray cp949/UTF-8 byte must not abort the stream
             cwd=specific_working_dir,
             env=env
         )
         
-        for line in iter(process.stdout.readline, ''):
-            if line:
-                yield line.rstrip()
-        
-        process.wait()
+        try:
+            for line in iter(process.stdout.readline, ''):
+                if line:
+                    yield line.rstrip()
+            
+            return process.wait() # exit code, available as StopIteration.value
+        finally:
+            # Generator closed early (consumer raised or stopped reading): do not leave the child running
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+    """
+    @brief	Execute a command, log its output live and keep only the last lines. 명령어를 실행하며 출력을 실시간으로 기록하고 마지막 줄만 보관합니다.
+    @param	cmd	        Command to execute 실행할 명령어
+    @param	tail_lines	Number of trailing output lines kept in the result 결과에 보관할 마지막 출력 줄 수
+    @param	raise_err	Raise ErrorCmdSystem on non-zero exit 0이 아닌 종료 코드에서 ErrorCmdSystem 발생
+    @param	cumstem_env	Environment for the child process, None inherits 자식 프로세스 환경 변수, None이면 상속
+    @param	on_line	    Called with every output line as it arrives; disabled after its first exception 출력 줄이 도착할 때마다 호출되는 콜백, 첫 예외 후 비활성화
+    @param	log_output	Log every output line at INFO 모든 출력 줄을 INFO로 기록
+    @param	encoding	Output encoding, None for the locale default 출력 인코딩, None이면 로케일 기본값
+    @return	Result holding the output tail (stdout on success, stderr on failure) 출력 끝부분을 담은 결과 (성공시 stdout, 실패시 stderr)
+    """
+    def run_live(
+            cmd: Union[str, List[str]],
+            tail_lines: int = 200,
+            raise_err: bool = True,
+            specific_working_dir: Optional[str] = None,
+            cumstem_env: Optional[Dict[str, str]] = None,
+            on_line: Optional[Callable[[str], None]] = None,
+            log_output: bool = True,
+            encoding: Optional[str] = None
+        ) -> Result:
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            JLogger().log_info(f"| cmd.exe | {' '.join(cmd) if isinstance(cmd, list) else cmd}")
+        tail = deque(maxlen=tail_lines) # memory stays bounded however much the command prints
+        stream = CmdSystem.run_streaming(cmd, specific_working_dir=specific_working_dir, env=cumstem_env, encoding=encoding)
+        try:
+            while True:
+                try:
+                    line = next(stream)
+                except StopIteration as stop:
+                    ret_code = stop.value
+                    break
+                tail.append(line)
+                if log_output:
+                    JLogger().log_info(f"| cmd.out | {line}")
+                if on_line is not None:
+                    try:
+                        on_line(line)
+                    except Exception as e:
+                        # A faulty callback must not abort the command it only observes; report once and stop calling it
+                        JLogger().log_error(f"| cmd.cb | on_line callback failed, disabled: {e}")
+                        on_line = None
+        finally:
+            stream.close() # kills and reaps the child if the loop was left early
+        output = '\n'.join(tail)
+        if ret_code != CmdSystem.ReturnCode.SUCCESS:
+            if raise_err:
+                raise ErrorCmdSystem(f"Command failed with return code {ret_code}: {output}")
+            return CmdSystem.Result(ret_code, "", output)
+        return CmdSystem.Result(ret_code, output, "")
 
     """
     @brief	Check if a command exists in the system PATH. 시스템 PATH에 명령어가 존재하는지 확인합니다.
@@ -616,8 +716,16 @@ class CmdSystem:
     @return	True if command exists, False otherwise 명령어가 존재하면 True, 아니면 False
     """
     def get_where(program_name: str) -> Optional[str]:
+        hit = CmdSystem._where_cache.get(program_name)
+        if hit is not None:
+            return hit
+        # In-process PATH/PATHEXT scan first, the common case needs no 'where'/'which' child process
+        found = shutil.which(program_name)
+        if found:
+            CmdSystem._where_cache[program_name] = found
+            return found
         try:
-            if sys.platform == 'win32':
+            if _IS_WIN:
                 cmd_ret: CmdSystem.Result = CmdSystem.run(['where', program_name], raise_err=False)
 
                 if not (cmd_ret.is_success() and cmd_ret.stdout):
@@ -627,32 +735,57 @@ class CmdSystem:
                 if cmd_ret.is_success() and cmd_ret.stdout:
                     for line in cmd_ret.stdout.strip().splitlines():
                         if os.path.exists(line):
+                            CmdSystem._where_cache[program_name] = line
                             return line  # 실제 존재하는 첫 번째 경로 반환
                 return None
             else:
-                cmd_ret: CmdSystem.Result = CmdSystem.run(['which', program_name], raise_err=False)
-                if cmd_ret.is_error(): return None
-                return cmd_ret.stdout.strip() if cmd_ret.stdout else None
+                # shutil.which already scanned the same PATH 'which' would
+                return None
         except ErrorCmdSystem as e:
             JLogger().log_error(f"where '{program_name}' not found: {e}")
             return None
 
+    # Positive get_version results: {(package_name, global_execute): version}
+    _version_cache: Dict[Tuple[Optional[str], bool], str] = {}
+
+    # Positive get_where results: {program_name: absolute path}
+    _where_cache: Dict[str, str] = {}
+
+    # Distribution names for in-process lookups via importlib.metadata
+    _DIST_NAMES: Dict[str, str] = {
+        'pip': 'pip',
+        'PyInstaller': 'pyinstaller',
+        'pillow': 'pillow',
+        'google-gemini': 'google-genai',
+        'ollama-lib': 'ollama',
+    }
+    # argv[1] is the distribution name, prints nothing when it is not installed
+    _DIST_VERSION_PROBE = 'import sys, importlib.metadata as m\ntry: print(m.version(sys.argv[1]))\nexcept m.PackageNotFoundError: pass'
+
+    def clear_version_cache() -> None:
+        # Call after installing/upgrading so the tool is re-detected
+        CmdSystem._version_cache.clear()
+        CmdSystem._where_cache.clear()
+        importlib.invalidate_caches()
+
     def get_version(package_name: Optional[str], global_execute: bool = False) -> Optional[str]:
+        cache_key = (package_name, global_execute)
+        if cache_key in CmdSystem._version_cache:
+            return CmdSystem._version_cache[cache_key]
         try:
+            # Current interpreter: read package metadata in-process instead of spawning pip
+            if not global_execute and package_name in CmdSystem._DIST_NAMES:
+                try:
+                    _ret = importlib.metadata.version(CmdSystem._DIST_NAMES[package_name])
+                except importlib.metadata.PackageNotFoundError:
+                    return None
+                CmdSystem._version_cache[cache_key] = _ret
+                return _ret
             if package_name in ['git', 'python']:
                 cmd = [package_name, '--version']
-            elif package_name in ['pip', 'PyInstaller']:
-                python_executable = "python" if global_execute else sys.executable
-                cmd = [python_executable, '-m', package_name, '--version']
-            elif package_name == 'pillow':
-                python_executable = "python" if global_execute else sys.executable
-                cmd = [python_executable, '-m', 'pip', 'show', 'pillow']
-            elif package_name == 'google-gemini':
-                python_executable = "python" if global_execute else sys.executable
-                cmd = [python_executable, '-m', 'pip', 'show', 'google-genai']
-            elif package_name == 'ollama-lib':
-                python_executable = "python" if global_execute else sys.executable
-                cmd = [python_executable, '-m', 'pip', 'show', 'ollama']
+            elif package_name in CmdSystem._DIST_NAMES:
+                # Global interpreter: a metadata-only probe, no pip startup and no import of the package itself
+                cmd = ["python", '-c', CmdSystem._DIST_VERSION_PROBE, CmdSystem._DIST_NAMES[package_name]]
             elif package_name == 'vcpkg':
                 cmd = ['vcpkg', '--version']
             elif package_name == 'nodejs':
@@ -661,8 +794,13 @@ class CmdSystem:
                 cmd = ['ollama', '--version']
             else:
                 raise ValueError(f"version check of this package is unsupported.")
+            # Zero-subprocess fast path: a bare tool name that is not on PATH cannot run
+            if not os.path.isabs(cmd[0]) and shutil.which(cmd[0]) is None:
+                return None
             cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=False)
-            _ret = TextUtils.extract_version(cmd_ret.stdout) if cmd_ret.is_success() else None
+            _ret = (TextUtils.extract_version(cmd_ret.stdout) or None) if cmd_ret.is_success() else None
+            if _ret: # only positive results, missing tools may be installed later
+                CmdSystem._version_cache[cache_key] = _ret
             return _ret
         except Exception as e:  # Other unexpected errors
             JLogger().log_error(f"{package_name}: {str(e)}")
@@ -702,7 +840,7 @@ class CmdSystem:
     """
     def kill_process_by_name(process_name: str) -> bool:
         try:
-            if sys.platform == 'win32':
+            if _IS_WIN:
                 cmd = ['taskkill', '/F', '/IM', process_name]
                 cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=False)
                 if cmd_ret.is_error(): return False
@@ -729,7 +867,7 @@ class CmdSystem:
     def get_process_list() -> Optional[List[Dict[str, str]]]:    
         try:
             processes = []
-            if sys.platform == 'win32':
+            if _IS_WIN:
                 cmd_ret: CmdSystem.Result = CmdSystem.run(['tasklist', '/FO', 'CSV', '/NH'], raise_err=False)
                 if cmd_ret.is_error(): return None
                 for line in cmd_ret.stdout.strip().split('\n'):
@@ -791,15 +929,23 @@ class FileSystem:
     def is_exe() -> bool: # exe로 패키징 되었는지 확인
         return bool(getattr(sys, "frozen", False))
 
+    # Elevation is fixed for the process lifetime, queried once
+    _is_admin: Optional[bool] = None
+
+    def is_admin() -> bool:
+        if FileSystem._is_admin is None:
+            FileSystem._is_admin = bool(ctypes.windll.shell32.IsUserAnAdmin())
+        return FileSystem._is_admin
+
     """
     @brief  Re-run the script with administrator privileges. 관리자 권한으로 스크립트를 다시 실행합니다.
     """
     def restart_as_admin():
-        if ctypes.windll.shell32.IsUserAnAdmin():
+        if FileSystem.is_admin():
             return  # 이미 관리자 권한으로 실행 중이면 아무 작업도 하지 않음
 
-        # 관리자 권한으로 실행하기 위한 명령어 생성
-        params = ' '.join([f'"{arg}"' for arg in sys.argv])
+        # 관리자 권한으로 실행하기 위한 명령어 생성 (Windows quoting rules: embedded quotes, trailing backslashes)
+        params = subprocess.list2cmdline(sys.argv)
         executable = sys.executable
         try:
             ctypes.windll.shell32.ShellExecuteW(
@@ -856,7 +1002,7 @@ class FileSystem:
         사용자의 Roaming AppData 디렉토리 경로를 반환합니다. (e.g., C:\\Users\\USERNAME\\AppData\\Roaming)
         On non-Windows systems, returns ~/.config.
         """
-        if sys.platform == 'win32':
+        if _IS_WIN:
             # Use APPDATA environment variable which points to Roaming
             return Path(os.environ.get('APPDATA', Path.home() / 'AppData' / 'Roaming')).resolve()
         else:
@@ -870,7 +1016,7 @@ class FileSystem:
         This is a common install location for user-scope apps like Python, VS Code, Ollama, etc.
         On non-Windows systems, returns ~/.local/programs.
         """
-        if sys.platform == 'win32':
+        if _IS_WIN:
             local_appdata = os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local')
             return (Path(local_appdata) / 'Programs').resolve()
         else:
@@ -890,7 +1036,7 @@ class FileSystem:
         Get the WindowsApps directory path.
         WindowsApps 디렉토리 경로를 반환합니다. (e.g., C:\\Users\\user\\AppData\\Local\\Microsoft\\WindowsApps)
         """
-        if sys.platform == 'win32':
+        if _IS_WIN:
             # Use LOCALAPPDATA environment variable which points to Local
             base = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
             return (base / 'Microsoft' / 'WindowsApps').resolve()
@@ -908,40 +1054,14 @@ class FileSystem:
             else:
                 # possiblity_1, not installed, try to install
                 JLogger().log_info(f"Module '{package_name}' is not installed or not found in PATH.")
-                if package_name == 'git':
-                    c_path = InstallSystem.WingetRelated.install_git_global(global_execute)
-                    need_envvar = True
-                elif package_name == 'python':
-                    c_path = InstallSystem.PythonRelated.install_python_global()
-                    need_envvar = True
-                elif package_name == 'pip':
-                    c_path = InstallSystem.PythonRelated.install_pip_global(global_execute, upgrade=True)
-                    need_envvar = False
-                elif package_name == 'pyinstaller':
-                    c_path = InstallSystem.PythonRelated.install_pyinstaller_global(global_execute, upgrade=True)
-                    need_envvar = False
-                elif package_name == 'pillow':
-                    c_path = InstallSystem.PythonRelated.install_pillow_lib_global(global_execute)
-                    need_envvar = False
-                elif package_name == 'google-gemini':
-                    c_path = InstallSystem.PythonRelated.install_genai_lib_global(global_execute)
-                    need_envvar = False
-                elif package_name == 'ollama-lib':
-                    c_path = InstallSystem.PythonRelated.install_ollama_lib_global(global_execute)
-                    need_envvar = False
-                elif package_name == 'vcpkg':
-                    c_path = InstallSystem.VcpkgRelated.install_vcpkg_global()
-                    need_envvar = True
-                elif package_name == 'nodejs':
-                    c_path = InstallSystem.WingetRelated.install_nodejs_global()
-                    need_envvar = True
-                elif package_name == 'ollama':
-                    c_path = InstallSystem.WingetRelated.install_ollama_app_global()
-                    global_execute = False
-                    need_envvar = True
-                else:
+                dispatch = _AUTO_INSTALLERS.get(package_name.lower()) if package_name else None
+                if dispatch is None:
                     JLogger().log_error(f"Automatic installation for '{package_name}' is not supported.")
                     raise ErrorInstallSystem(f"Package install unsupported: '{package_name}'.")
+                installer, need_envvar = dispatch
+                c_path = installer(global_execute)
+                if package_name == 'ollama':
+                    global_execute = False # user-scope app
                 
                 JLogger().log_info(f"Module '{package_name}' installed successfully." if c_path else f"Failed to install module '{package_name}'.")
                 
@@ -993,6 +1113,24 @@ class FileSystem:
             raise ErrorFileSystem(f"Failed to delete directory: {str(e)}") # exit_proper
 
 
+    """
+    @brief	Remove a directory tree in-process, clearing read-only flags that block deletion. 읽기 전용 속성을 해제하며 프로세스 안에서 디렉토리 트리를 삭제합니다.
+    @param	path	Directory to remove 삭제할 디렉토리
+    @return	None
+    @throws	FileNotFoundError: If the directory does not exist 디렉토리가 없을 시
+    @throws	OSError: If an entry cannot be removed even after clearing its read-only flag 읽기 전용 해제 후에도 항목을 삭제할 수 없을 시
+    """
+    def rmtree_fast(path: str) -> None:
+        # No 'rmdir /s /q' child process: it exits 0 on partial failure and costs a spawn per tree
+        # Read-only files (e.g. .git objects, PyInstaller-copied DLLs) fail on Windows: make writable and retry once
+        def retry_writable(func, failed_path, _exc):
+            os.chmod(failed_path, stat.S_IWRITE)
+            func(failed_path)
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=retry_writable)
+        else:
+            shutil.rmtree(path, onerror=retry_writable)
+
     """
     @brief	Copy a file from source to destination. 소스에서 목적지로 파일을 복사합니다.
     @param	src	        Source file path 소스 파일 경로
@@ -1104,14 +1242,28 @@ class FileSystem:
     """
     def check_file(path_file: str, f_back: int = 0) -> bool:
         c_path_file = Path(path_file)
-        if c_path_file.exists():
-            size_bytes = c_path_file.stat().st_size
-            size_info = FileSystem.format_size(size_bytes)
-            JLogger().log_info(f"File exists: {c_path_file}, Size: {size_info}", f_back)
-            return True
-        else:
+        try:
+            size_bytes = c_path_file.stat().st_size # single stat doubles as the existence check
+        except OSError:
             JLogger().log_info(f"File does not exist: {c_path_file}", f_back)
             return False
+        size_info = FileSystem.format_size(size_bytes)
+        JLogger().log_info(f"File exists: {c_path_file}, Size: {size_info}", f_back)
+        return True
+
+    """
+    @brief	Stat every path once and collect the ones that do not exist. 모든 경로를 한 번씩 stat하여 존재하지 않는 경로를 모읍니다.
+    @param	paths	Paths to check 확인할 경로 목록 (List[str])
+    @return	Missing paths in input order, empty if all exist 입력 순서대로의 누락 경로, 모두 존재하면 빈 리스트
+    """
+    def find_missing_paths(paths: List[str]) -> List[str]:
+        missing = []
+        for path in paths:
+            try:
+                os.stat(path)
+            except OSError: # FileNotFoundError, or NotADirectoryError for a path through a regular file, as os.path.exists
+                missing.append(path)
+        return missing
 
     def get_tree_size(path):
         total = 0
@@ -1416,23 +1568,40 @@ class FileSystem:
                 file_path = os.path.join(root, file)
                 callback(file_path)
 
+    # Shared opener: one SSL context (CA store loaded once) for every HTTPS request
+    _url_opener: Optional[urllib.request.OpenerDirector] = None
+
+    """
+    @brief	Open a URL through the shared opener. 공유 오프너로 URL을 엽니다.
+    @param	request	URL or Request object URL 또는 Request 객체
+    @param	timeout	Timeout in seconds, None for the global default 타임아웃 (초), None이면 전역 기본값
+    @return	HTTP response object HTTP 응답 객체
+    """
+    def open_url(request: Union[str, urllib.request.Request], timeout: Optional[float] = None):
+        if FileSystem._url_opener is None:
+            FileSystem._url_opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl.create_default_context()))
+        if timeout is None:
+            return FileSystem._url_opener.open(request)
+        return FileSystem._url_opener.open(request, timeout=timeout)
+
     """
     @brief	Download a file from a given URL. 주어진 URL에서 파일을 다운로드합니다.
     @param	url	        URL of the file 파일의 URL
     @param	save_path	Path to save the downloaded file 다운로드한 파일을 저장할 경로
     @param	timeout	    Timeout in seconds (default: 600) 타임아웃 (초)
+    @param	sha256	    Expected SHA-256 hex digest of the file (optional) 파일의 예상 SHA-256 16진 다이제스트 (선택사항)
     @return	None
     """
-    def download_url(url: str, save_path: str, timeout: int = 600) -> None:
+    def download_url(url: str, save_path: str, timeout: int = 600, sha256: Optional[str] = None) -> None:
         # If save_path is a string and looks like a path (contains / or \), convert to Path
         if isinstance(save_path, str) and not ("/" in save_path or "\\" in save_path):
             save_path = Path.home() / "Downloads" / save_path
+        save_path = Path(save_path)
         if not FileSystem.file_exists(save_path):
             JLogger().log_info(f"Downloading from: {url}...")
             try:
                 #urllib.request.urlretrieve(url, save_path)
-                with urllib.request.urlopen(url, timeout=timeout) as response, open(save_path, 'wb') as out_file:
-                    shutil.copyfileobj(response, out_file)
+                FileSystem._download_with_resume(url, save_path, timeout, sha256=sha256)
                 JLogger().log_info(f"Saved to: {save_path}")
             except Exception as e:
                 JLogger().log_error(f"Download failed: {e}")
@@ -1441,21 +1610,132 @@ class FileSystem:
             JLogger().log_info(f"File already exists: {save_path}")
 
     """
-    @brief	Download a file using curl from a given URL. 주어진 URL에서 curl을 사용하여 파일을 다운로드합니다.
+    @brief	Download several files concurrently. 여러 파일을 동시에 다운로드합니다.
+    @param	downloads	List of (url, save_path) pairs (url, 저장 경로) 쌍 리스트
+    @param	max_workers	Maximum concurrent downloads (default: 8) 최대 동시 다운로드 수
+    @param	timeout	    Timeout in seconds per download (default: 600) 다운로드당 타임아웃 (초)
+    @return	None
+    @throws	ErrorFileSystem: If any download fails 하나라도 다운로드 실패 시
+    """
+    def download_urls(
+            downloads: List[Tuple[str, str]],
+            max_workers: int = 8,
+            timeout: int = 600
+        ) -> None:
+        if not downloads:
+            return
+        failed = []
+        # Network-bound: worker threads overlap connection setup and transfer of each file
+        # Short-lived executor joined by the with block; a ThreadPoolSystem would leave an atexit hook per call
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(downloads))) as pool:
+            jobs = [(url, pool.submit(FileSystem.download_url, url, save_path, timeout)) for url, save_path in downloads]
+            for url, job in jobs:
+                try:
+                    job.result()
+                except Exception as e:
+                    failed.append(f"{url} ({e})")
+        if failed:
+            raise ErrorFileSystem(f"Failed to download: {', '.join(failed)}") # exit_proper
+
+    """
+    @brief	Download into '<save_path>.part' with Range resume and exponential backoff, then rename. '<save_path>.part'에 Range 이어받기와 지수 백오프로 다운로드한 후 이름을 바꿉니다.
+    @param	url	            URL of the file 파일의 URL
+    @param	save_path	    Final path of the downloaded file 다운로드 파일의 최종 경로
+    @param	timeout	        Timeout in seconds per attempt 시도당 타임아웃 (초)
+    @param	retries	        Number of retries after the first attempt 첫 시도 이후 재시도 횟수
+    @param	backoff_factor	Base delay in seconds, doubled on every retry 재시도마다 두 배가 되는 기본 지연 (초)
+    @param	sha256	        Expected SHA-256 hex digest, checked before the rename (optional) 이름 변경 전에 확인할 SHA-256 16진 다이제스트 (선택사항)
+    @return	None
+    """
+    def _download_with_resume(url: str, save_path: Path, timeout: int = 600, retries: int = 5, backoff_factor: float = 0.5, sha256: Optional[str] = None) -> None:
+        part_path = save_path.with_name(save_path.name + '.part')
+        last_error: Optional[Exception] = None
+        for attempt in range(retries + 1):
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            headers = {'Range': f'bytes={offset}-'} if offset else {}
+            try:
+                with FileSystem.open_url(urllib.request.Request(url, headers=headers), timeout=timeout) as response:
+                    # 206: server honoured Range -> append, 200: full body -> start over
+                    mode = 'ab' if offset and response.status == 206 else 'wb'
+                    with open(part_path, mode) as out_file:
+                        shutil.copyfileobj(response, out_file, 65536)
+                        # Data must be on disk before the rename makes the file visible
+                        out_file.flush()
+                        os.fsync(out_file.fileno())
+                if sha256:
+                    with open(part_path, 'rb') as part_file:
+                        digest = hashlib.file_digest(part_file, 'sha256').hexdigest() if hasattr(hashlib, 'file_digest') else hashlib.sha256(part_file.read()).hexdigest()
+                    if digest != sha256.lower():
+                        part_path.unlink(missing_ok=True)
+                        raise ErrorFileSystem(f"SHA-256 mismatch for {url}: expected {sha256}, got {digest}")
+                os.replace(part_path, save_path)
+                return
+            except urllib.error.HTTPError as e:
+                last_error = e
+                if e.code == 416: # Range not satisfiable, restart from scratch
+                    part_path.unlink(missing_ok=True)
+                    continue
+                if e.code not in (500, 502, 503, 504):
+                    raise
+            except (OSError, http.client.HTTPException) as e: # URLError, timeout, reset, IncompleteRead
+                last_error = e
+            if attempt < retries:
+                delay = backoff_factor * (2 ** attempt)
+                JLogger().log_warning(f"Download interrupted ({last_error}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+        raise ErrorFileSystem(f"Download failed after {retries + 1} attempts: {last_error}")
+
+    """
+    @brief	Download a file using libcurl (pycurl) from a given URL, urllib if unavailable. 주어진 URL에서 libcurl(pycurl)을 사용하여 파일을 다운로드합니다. 없으면 urllib 사용.
     @param	url	        URL of the file 파일의 URL
     @param	save_path	Path to save the downloaded file 다운로드한 파일을 저장할 경로
     @return	None
     """
     def download_url_curl(url: str, save_path: str) -> None:
-        cmd_download_python = [
-                'curl',
-                "-o", 
-                str(save_path),
-                url
-            ]
+        save_path = Path(save_path)
         if not save_path.exists():
             JLogger().log_info(f"Downloading from: {url}...")
-            CmdSystem.run(cmd_download_python, raise_err=True)
+            try:
+                import pycurl
+            except ImportError:
+                pycurl = None
+            if pycurl is not None:
+                # In-process libcurl, resumes a previous partial download
+                part_path = save_path.with_name(save_path.name + '.part')
+                with open(part_path, 'ab') as out_file:
+                    curl = pycurl.Curl()
+                    try:
+                        curl.setopt(pycurl.URL, url)
+                        curl.setopt(pycurl.WRITEDATA, out_file)
+                        curl.setopt(pycurl.RESUME_FROM_LARGE, out_file.tell())
+                        curl.setopt(pycurl.FOLLOWLOCATION, True)
+                        curl.setopt(pycurl.FAILONERROR, True)
+                        try:
+                            curl.perform()
+                        except pycurl.error as e:
+                            if e.args[0] != pycurl.E_RANGE_ERROR:
+                                raise
+                            # Server ignores Range: restart from scratch
+                            out_file.seek(0)
+                            out_file.truncate()
+                            curl.setopt(pycurl.RESUME_FROM_LARGE, 0)
+                            curl.perform()
+                    except pycurl.error as e:
+                        download_error = e
+                        status = curl.getinfo(pycurl.RESPONSE_CODE)
+                    else:
+                        download_error = None
+                    finally:
+                        curl.close()
+                if download_error is not None:
+                    # HTTP error body is not file data: drop the .part so the next call does not resume from it
+                    if status and not 200 <= status < 300:
+                        part_path.unlink(missing_ok=True)
+                    raise ErrorFileSystem(f"Download failed: {download_error}") # exit_proper
+                os.replace(part_path, save_path)
+            else:
+                # No libcurl binding: stay in-process with the resumable urllib path instead of spawning curl
+                FileSystem._download_with_resume(url, save_path)
             JLogger().log_info(f"Saved to: {save_path}")
         else:
             JLogger().log_info(f"File already exists: {save_path}")
@@ -1468,7 +1748,7 @@ class ErrorInstallSystem(JErrorSystem): pass
 class InstallSystem:
     def fetch_url_to_json(api_url: str) -> Union[list, dict]:
         try:
-            with urllib.request.urlopen(api_url) as response:
+            with FileSystem.open_url(api_url) as response:
                 if response.status == 200:
                     return json.loads(response.read())
                 else:
@@ -1478,19 +1758,89 @@ class InstallSystem:
     
     class ErrorPythonRelated(ErrorInstallSystem): pass
     class PythonRelated:
-        def get_url_latest_python_with_filename() -> Tuple[str, str]:
+        _AMD64_RE = re.compile(r'-amd64\.exe$')
+        _CACHE_ROOT = Path.home() / '.cache' / 'py_sys_script' # every on-disk cache of this namespace lives under here
+        _LATEST_CACHE_FILE = _CACHE_ROOT / 'latest_python.json' # {etag, last_modified, url, filename, cached_at}
+
+        _LATEST_CACHE_TTL = 86400 # seconds a cached result is trusted without contacting python.org
+        _latest_memo: Optional[Tuple[str, str]] = None # in-process result
+        _PYI_WORK_ROOT = _CACHE_ROOT / 'pyinstaller' # per-script --workpath, kept across builds
+        _pyi_run_lock = threading.Lock() # PyInstaller.__main__.run mutates process-global state, one in-process build at a time
+        _build_pool: Optional[ThreadPoolSystem] = None # lazily created for build_exe_with_pyinstaller_async
+        _build_pool_lock = threading.Lock() # guards _build_pool and _build_futures
+        _build_futures: Set[Future] = set() # async builds not finished yet, cancelled or awaited at exit
+
+        def get_url_latest_python_with_filename(invalidate_cache: bool = False) -> Tuple[str, str]:
             api_url = "https://www.python.org/api/v2/downloads/release/"
-            list_releases = InstallSystem.fetch_url_to_json(api_url)
-            for dict_release in list_releases:
-                if dict_release["is_published"]:
-                    for file in dict_release["files"]:
-                        if "amd64.exe" in file["url"]:
-                            file_name = file["url"].split("/")[-1]
-                            return file["url"], file_name
-            raise InstallSystem.ErrorPythonRelated("Failed to fetch the latest Python URL")
-
-        def install_python_global() -> Optional[Path]:
+            cache_file = InstallSystem.PythonRelated._LATEST_CACHE_FILE
+            if invalidate_cache:
+                InstallSystem.PythonRelated._latest_memo = None
+            elif InstallSystem.PythonRelated._latest_memo is not None:
+                return InstallSystem.PythonRelated._latest_memo
+            try:
+                dict_cached = {} if invalidate_cache else json.loads(cache_file.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                dict_cached = {}
+
+            # Fresh on-disk result: no network round-trip at all
+            if dict_cached.get('url') and time.time() - dict_cached.get('cached_at', 0) < InstallSystem.PythonRelated._LATEST_CACHE_TTL:
+                InstallSystem.PythonRelated._latest_memo = (dict_cached['url'], dict_cached['filename'])
+                return InstallSystem.PythonRelated._latest_memo
+
+            # Conditional request: 304 Not Modified skips downloading/parsing the release list
+            headers = {}
+            if dict_cached.get('url'):
+                if dict_cached.get('etag'):
+                    headers['If-None-Match'] = dict_cached['etag']
+                if dict_cached.get('last_modified'):
+                    headers['If-Modified-Since'] = dict_cached['last_modified']
+            try:
+                import ijson # optional: parse the release list incrementally
+            except ImportError:
+                ijson = None
+            amd64_re = InstallSystem.PythonRelated._AMD64_RE
+            try:
+                with FileSystem.open_url(urllib.request.Request(api_url, headers=headers)) as response:
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    # With ijson only one release object is held at a time and the socket closes on the first match
+                    list_releases = ijson.items(response, 'item') if ijson is not None else json.load(response)
+                    # Stop at the first published amd64 installer
+                    url = next((file["url"] for dict_release in list_releases if dict_release["is_published"]
+                                for file in dict_release["files"] if amd64_re.search(file["url"])), None)
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    url, file_name = dict_cached['url'], dict_cached['filename']
+                    etag, last_modified = dict_cached.get('etag'), dict_cached.get('last_modified')
+                else:
+                    raise InstallSystem.ErrorPythonRelated(f"Failed to fetch data from API (HTTP {e.code})")
+            else:
+                if url is None:
+                    raise InstallSystem.ErrorPythonRelated("Failed to fetch the latest Python URL")
+                file_name = url.rsplit("/", 1)[-1]
+
             try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps({'etag': etag, 'last_modified': last_modified, 'url': url, 'filename': file_name, 'cached_at': time.time()}), encoding='utf-8')
+            except OSError as e:
+                JLogger().log_warning(f"Failed to write latest-Python cache: {e}")
+            InstallSystem.PythonRelated._latest_memo = (url, file_name)
+            return url, file_name
+
+        """
+        @brief	Install the latest Python globally unless a Python 3 is already available. Python 3가 없으면 최신 Python을 전역에 설치합니다.
+        @param	force	Run the installer even if a Python 3 is found (default: False) Python 3가 있어도 설치 프로그램 실행 (기본값: False)
+        @return	Path to the python executable, None on failure python 실행 파일 경로, 실패시 None
+        """
+        def install_python_global(force: bool = False) -> Optional[Path]:
+            try:
+                # A working Python 3 on PATH makes the download + installer run a no-op
+                if not force:
+                    existing_version = CmdSystem.get_version('python', global_execute=True)
+                    if existing_version and existing_version.startswith('3.'):
+                        JLogger().log_info(f"Python {existing_version} is already installed, skipping installer.")
+                        # get_version ran the bare 'python' command, so resolve that same name; never report None on success
+                        return Path(CmdSystem.get_where('python') or 'python')
                 python_url, python_filename = InstallSystem.PythonRelated.get_url_latest_python_with_filename()
                 path_where_python_download = Path.home() / "Downloads" / python_filename
 
@@ -1505,7 +1855,11 @@ class InstallSystem:
                     "PrependPath=1",  # PATH 환경 변수에 추가
                 ]
                 cmd_ret: CmdSystem.Result = CmdSystem.run(cmd_install_python, raise_err=True)
-                return CmdSystem.get_where('python') if cmd_ret.is_success() else None
+                CmdSystem.clear_version_cache()
+                if not cmd_ret.is_success():
+                    return None
+                found = CmdSystem.get_where('python')
+                return Path(found) if found else None
             except InstallSystem.ErrorPythonRelated as e:
                 JLogger().log_error(f"{str(e)}")
                 return None
@@ -1513,13 +1867,37 @@ class InstallSystem:
                 JLogger().log_error(f"Failed to install Python: {str(e)}")
                 return None
 
+        """
+        @brief	Locate a console script installed for an interpreter, optionally running it once. 인터프리터에 설치된 콘솔 스크립트를 찾고, 선택적으로 한 번 실행해 확인합니다.
+        @param	python_executable	Interpreter name or path 인터프리터 이름 또는 경로
+        @param	module	            Module run as 'python -m <module> --version' when verify 검증 시 'python -m <module> --version'으로 실행할 모듈
+        @param	tool	            Console script name without suffix (e.g., 'pip') 확장자 없는 콘솔 스크립트 이름
+        @param	verify	            Run the module's --version first, None if it fails 먼저 --version을 실행하여 실패하면 None
+        @return	Path to the script, PATH lookup as fallback; None if not found or not working 스크립트 경로 (PATH 검색으로 대체), 없거나 동작하지 않으면 None
+        """
+        def _find_installed_tool(python_executable: str, module: str, tool: str, verify: bool = False) -> Optional[Path]:
+            if verify and not CmdSystem.run([python_executable, '-m', module, '--version'], raise_err=False, quiet=True).is_success():
+                return None
+            interpreter = Path(shutil.which(python_executable) or python_executable)
+            # Windows keeps console scripts in Scripts\ beside python.exe, POSIX next to the interpreter in bin/
+            for candidate in (interpreter.parent / 'Scripts' / (tool + _EXE_SUFFIX), interpreter.parent / (tool + _EXE_SUFFIX)):
+                if candidate.is_file():
+                    return candidate
+            found = CmdSystem.get_where(tool)
+            return Path(found) if found else None
+
         """
         @brief	Install pip globally or temporarily. pip를 전역 또는 임시로 설치합니다.
         @param	global_execute	Whether to install pip globally (True) or temporarily (False) pip를 전역에 설치할지 여부 (True: 전역, False: 임시)
-        @return	True if pip is successfully installed, False otherwise pip가 성공적으로 설치되면 True, 아니면 False
+        @param	verify	        Run 'python -m pip --version' before returning (default: False) 반환 전에 'python -m pip --version' 실행 (기본값: False)
+        @return	Path to the target interpreter's pip, None on failure pip 경로, 실패시 None
         """
-        def install_pip_global(global_execute: bool = True, upgrade: bool = False) -> Optional[Path]:
+        def install_pip_global(global_execute: bool = True, upgrade: bool = False, verify: bool = False) -> Optional[Path]:
             try:
+                # pip already importable by the target interpreter: nothing for ensurepip to do
+                if not upgrade and CmdSystem.get_version('pip', global_execute):
+                    return InstallSystem.PythonRelated._find_installed_tool('python' if global_execute else sys.executable, 'pip', 'pip', verify)
+
                 # undercover
                 FileSystem.ensure_installed('python') if global_execute else None
 
@@ -1530,8 +1908,12 @@ class InstallSystem:
                     'ensurepip',
                     '--upgrade' if upgrade else ''
                 ]
-                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd_install_pip, raise_err=True)
-                return CmdSystem.get_where('pip') if cmd_ret.is_success() else None                
+                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd_install_pip, raise_err=True, quiet=True)
+                CmdSystem.clear_version_cache()
+                if not cmd_ret.is_success():
+                    return None
+                # raise_err=True already fails on non-zero exit, so the --version run is opt-in
+                return InstallSystem.PythonRelated._find_installed_tool(cmd_install_pip[0], 'pip', 'pip', verify)
             except Exception as e:
                 JLogger().log_error(f"Failed to install pip: {e}")
                 return None
@@ -1540,41 +1922,81 @@ class InstallSystem:
         @brief	Install PyInstaller globally. PyInstaller를 전역에 설치합니다.
         @param	version	    Specific version to install (optional) 설치할 특정 버전 (선택사항)
         @param	upgrade	    Upgrade if already installed (default: False) 이미 설치된 경우 업그레이드 여부 (기본값: False)
-        @return	Tuple of (success: bool, message: str) (성공 여부, 메시지) 튜플
+        @param	verify	    Run 'python -m PyInstaller --version' before returning (default: False) 반환 전에 'python -m PyInstaller --version' 실행 (기본값: False)
+        @param	pip_cache_dir	pip wheel cache directory, None keeps pip's per-user default; CI should restore it between runs pip 휠 캐시 디렉토리, None이면 pip 기본값 (CI에서는 실행 간 복원 권장)
+        @return	Path to the target interpreter's pyinstaller, None on failure pyinstaller 경로, 실패시 None
         @throws	InstallPyError: If installation fails 설치 실패 시
         """
         def install_pyinstaller_global(
             global_execute: bool = True,
             upgrade: bool = False,
             version: Optional[str] = None,
+            verify: bool = False,
+            pip_cache_dir: Optional[str] = None,
             ) -> Optional[Path]:
             try:
+                python_executable = 'python' if global_execute else sys.executable
+
+                # Requested version already present: skip pip and its resolver pass entirely
+                if not upgrade:
+                    current = CmdSystem.get_version('PyInstaller', global_execute)
+                    if current is not None and (version is None or current == version):
+                        JLogger().log_info(f"PyInstaller {current} already installed.")
+                        return InstallSystem.PythonRelated._find_installed_tool(python_executable, 'PyInstaller', 'pyinstaller', verify)
+
                 # undercover
                 FileSystem.ensure_installed('pip')
 
                 # execute
                 cmd_install_pyinstaller = [
-                    'python' if global_execute else sys.executable,
+                    python_executable,
                     '-m',
                     'pip',
                     'install',
+                    '--disable-pip-version-check', # skip pip's PyPI self-check round-trip on every run
+                    '--prefer-binary', # take a wheel over building an sdist
+                    *(['--cache-dir', pip_cache_dir] if pip_cache_dir else []),
                     'pyinstaller' + (f'=={version}' if version else ''),
                     '--upgrade' if upgrade else ''
                 ]                
-                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd_install_pyinstaller, raise_err=True)
-                return CmdSystem.get_where('PyInstaller') if cmd_ret.is_success() else None
+                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd_install_pyinstaller, raise_err=True, quiet=True)
+                CmdSystem.clear_version_cache()
+                if not cmd_ret.is_success():
+                    return None
+                return InstallSystem.PythonRelated._find_installed_tool(python_executable, 'PyInstaller', 'pyinstaller', verify)
             except Exception as e:
                 error_msg = f"Unexpected error installing PyInstaller: {str(e)}"
                 raise InstallSystem.ErrorPythonRelated(error_msg)
         
+        """
+        @brief	Get the persistent PyInstaller work directory for a script. 스크립트별 영구 PyInstaller 작업 디렉토리를 가져옵니다.
+        @param	path_script	Path to Python script 파이썬 스크립트 경로
+        @return	Path keyed by the script's absolute path 스크립트 절대 경로로 구분되는 경로
+        """
+        def get_pyinstaller_workpath(path_script: str) -> Path:
+            digest = hashlib.sha1(os.path.abspath(path_script).encode('utf-8')).hexdigest()
+            return InstallSystem.PythonRelated._PYI_WORK_ROOT / digest
+
         """
         @brief	Build an executable from a Python script using PyInstaller. PyInstaller를 사용하여 파이썬 스크립트에서 실행 파일을 빌드합니다.
         @param	path_script	    Path to Python script to build 빌드할 파이썬 스크립트 경로 (str)
         @param	path_icon	    Path to icon file (.ico on Windows, .icns on macOS) 아이콘 파일 경로 (.ico Windows, .icns macOS) (Optional[str])
         @param	path_rsc	    List of (srcpath, dest_rel) tuples for data files; OS-specific separator is handled automatically OS별 구분자가 자동으로 처리되는 데이터 파일을 위한 (srcpath, dest_rel) 튜플 목록
-        @param	onefile	        Bundle everything into single file 모든 것을 단일 파일로 번들 (default: True)
+        @param	onefile	        Bundle everything into single file; onedir avoids the per-launch temp extraction 모든 것을 단일 파일로 번들, onedir는 실행마다 임시 폴더 압축 해제를 피함 (default: False)
         @param	console	    Create windowed application (no console) 윈도우 응용프로그램 생성 (콘솔 없음) (default: False)
         @param	path_py	        Path to Python executable 파이썬 실행 파일 경로 (Optional[str], None이면 현재 인터프리터 사용)
+        @param	verbose	        Log PyInstaller output live for subprocess builds PyInstaller 출력을 실시간으로 기록 (서브프로세스 빌드) (default: False)
+        @param	hidden_imports	Modules PyInstaller cannot detect statically 정적 분석으로 찾지 못하는 모듈 목록 (Optional[List[str]])
+        @param	exclude_modules	Modules to leave out of the bundle 번들에서 제외할 모듈 목록 (Optional[List[str]])
+        @param	workpath	    PyInstaller work directory, None uses a persistent per-script cache so Analysis is reused 작업 디렉토리, None이면 스크립트별 영구 캐시를 사용해 분석 결과 재사용 (Optional[str])
+        @param	clean	        Pass --clean, discarding the cached Analysis for a full rebuild --clean 전달, 캐시된 분석을 버리고 전체 재빌드 (default: False)
+        @param	log_level	    PyInstaller --log-level (TRACE, DEBUG, INFO, WARN, ERROR, FATAL) PyInstaller 로그 레벨 (default: 'WARN')
+        @param	use_upx	        Let PyInstaller compress binaries with UPX when found; False (--noupx) often cuts build time several-fold for a larger bundle UPX 압축 사용, False(--noupx)면 빌드가 훨씬 빨라지나 번들이 커짐 (default: True)
+        @param	strip	        Strip symbol tables from binaries (--strip, non-Windows) 바이너리의 심볼 테이블 제거 (default: False)
+        @param	upx_dir	        Directory containing the UPX executable (--upx-dir) UPX 실행 파일 디렉토리 (Optional[str])
+        @param	progress_callback	Called with each PyInstaller output line of a subprocess build, exceptions are logged and disable it 서브프로세스 빌드의 PyInstaller 출력 줄마다 호출 (Optional[Callable[[str], None]])
+        @param	config_dir	    PYINSTALLER_CONFIG_DIR for this build, forces a subprocess build; None shares the user cache 이 빌드의 PYINSTALLER_CONFIG_DIR, 지정시 서브프로세스 빌드; None이면 사용자 캐시 공유 (Optional[str])
+        @param	in_process	    Run PyInstaller inside this process (current interpreter only), skipping an interpreter start; the default subprocess keeps the host's logging, sys.path and sys.modules untouched 현재 프로세스 안에서 PyInstaller 실행 (현재 인터프리터만), 기본값인 서브프로세스는 호스트 상태를 건드리지 않음 (default: False)
         @return	None (prints output and calls subprocess directly)
         @throws	subprocess.CalledProcessError: If build fails 빌드 실패 시
         """
@@ -1583,50 +2005,108 @@ class InstallSystem:
                 path_icon: Optional[str] = None,
                 path_rsc: Optional[List[Tuple[str, str]]] = None,
                 global_execute: bool = False,
-                onefile: bool = True,
+                onefile: bool = False,
                 console: bool = True,
+                verbose: bool = False,
+                hidden_imports: Optional[List[str]] = None,
+                exclude_modules: Optional[List[str]] = None,
+                workpath: Optional[str] = None,
+                clean: bool = False,
+                log_level: str = 'WARN',
+                config_dir: Optional[str] = None,
+                in_process: bool = False,
+                progress_callback: Optional[Callable[[str], None]] = None,
+                use_upx: bool = True,
+                strip: bool = False,
+                upx_dir: Optional[str] = None,
             ) -> bool:
             if FileSystem.check_file(path_script):
-                # python -m PyInstaller --clean --onefile  (--console) (--icon /icon.ico) (--add-data /pathRsc:tempName) /pathTarget.py
+                # python -m PyInstaller (--clean) --noconfirm --log-level WARN --onefile  (--console) (--icon /icon.ico) (--add-data /pathRsc:tempName) /pathTarget.py
                 try:
-                    if not FileSystem.ensure_installed('PyInstaller', global_execute=global_execute):
+                    # Opt-in: same interpreter with PyInstaller importable, no probe subprocess, build in-process below
+                    # A separate config_dir needs a fresh process, PyInstaller reads PYINSTALLER_CONFIG_DIR once at import
+                    # verbose/progress_callback read the output stream, which only a subprocess build produces
+                    in_process = (in_process and config_dir is None and progress_callback is None and not verbose
+                                  and not global_execute and not FileSystem.is_exe() and importlib.util.find_spec('PyInstaller') is not None)
+                    if not in_process and not FileSystem.ensure_installed('PyInstaller', global_execute=global_execute):
                         raise InstallSystem.ErrorPythonRelated("PyInstaller is not installed or not found in PATH.")
                     
                     # Determine the Python executable based on global_execute flag
                     python_executable = "python" if global_execute else sys.executable                    
-                    cmd = [python_executable, "-m", "PyInstaller", "--clean"]
 
-                    # onefile option
-                    cmd.append("--onefile" if onefile else "--onedir")
+                    # icon and add-data sources validated in one stat pass, every missing input reported together
+                    # glob patterns in an add-data source are expanded by PyInstaller itself, so they are not stat'ed
+                    inputs = ([path_icon] if path_icon else []) + [src for src, _ in (path_rsc or ()) if not any(c in src for c in '*?[')]
+                    missing = FileSystem.find_missing_paths(inputs)
+                    if missing:
+                        raise FileNotFoundError("Build input not found:\n" + "\n".join(f"  {p}" for p in missing))
+                    icon = str(Path(path_icon).resolve()) if path_icon else None
 
-                    # console option
-                    if not console:
-                        cmd.append("--noconsole")
+                    # script path, already checked by check_file above
+                    c_path_script = Path(path_script)
 
-                    # icon option
-                    if path_icon:
-                        c_path_icon = Path(path_icon)
-                        if c_path_icon.exists():
-                            cmd += ["--icon", str(c_path_icon)]
-                        else:
-                            raise FileNotFoundError(f"Icon file not found: {c_path_icon}")
-                    
-                    # rsc add-data option
-                    if path_rsc:
-                        seperator = os.pathsep # Use os.pathsep for  ';' separator on Windows, ':' on other OS, PyInstaller's --add-data uses
-                        for src, dst in path_rsc:
-                            cmd += ["--add-data", f"{src}{seperator}{dst}"]
+                    # Persistent workpath outside cwd: PyInstaller reuses its Analysis between builds of the same script
+                    workpath = workpath or str(InstallSystem.PythonRelated.get_pyinstaller_workpath(path_script))
+
+                    # Whole argv in one display, each option contributes an empty or filled slice
+                    # _PATHSEP: ';' separator on Windows, ':' on other OS, PyInstaller's --add-data uses
+                    # Order-preserving dedup (dict.fromkeys), repeated entries would only be re-analysed by PyInstaller
+                    cmd = [
+                        python_executable, "-m", "PyInstaller",
+                        *(["--clean"] if clean else []),
+                        "--workpath", workpath,
+                        # never stop on the overwrite prompt for an existing dist/<name>, and keep INFO chatter off the pipe
+                        "--noconfirm", "--log-level", log_level,
+                        "--onefile" if onefile else "--onedir",
+                        *(["--noconsole"] if not console else []),
+                        *(["--icon", icon] if icon else []),
+                        *(["--noupx"] if not use_upx else []),
+                        *(["--strip"] if strip else []),
+                        *(["--upx-dir", upx_dir] if upx_dir else []),
+                        *chain.from_iterable(("--add-data", f"{src}{_PATHSEP}{dst}") for src, dst in dict.fromkeys(map(tuple, path_rsc or ()))),
+                        *chain.from_iterable(("--hidden-import", mod) for mod in dict.fromkeys(hidden_imports or ())),
+                        *chain.from_iterable(("--exclude-module", mod) for mod in dict.fromkeys(exclude_modules or ())),
+                        str(c_path_script),
+                    ]
 
-                    # script path
-                    c_path_script = Path(path_script)
-                    if not c_path_script.exists():
-                        raise FileNotFoundError(f"Script not found: {c_path_script}")
-                    else:
-                        cmd.append(str(c_path_script))
+                    # onedir places the executable inside dist/<name>/
+                    path_output = f"dist/{c_path_script.stem}{_EXE_SUFFIX}" if onefile else f"dist/{c_path_script.stem}/{c_path_script.stem}{_EXE_SUFFIX}"
 
                     # Run 
-                    if CmdSystem.run(cmd, raise_err=True).is_success():  # 0 means no stderr
-                        return FileSystem.check_file(f"dist/{c_path_script.stem}.exe")
+                    if in_process:
+                        # Documented programmatic entry point, skips a second interpreter cold start
+                        if logging.getLogger().isEnabledFor(logging.INFO):
+                            JLogger().log_info(f"| pyi.run | {' '.join(cmd[3:])}")
+                        # PyInstaller calls logging.basicConfig on import, extends sys.path and exits via sys.exit;
+                        # snapshot the host process state and put it back whatever the outcome
+                        root_logger = logging.getLogger()
+                        with InstallSystem.PythonRelated._pyi_run_lock:
+                            saved_handlers, saved_level, saved_sys_path = root_logger.handlers[:], root_logger.level, sys.path[:]
+                            try:
+                                from PyInstaller.__main__ import run as pyi_run
+                                pyi_run(cmd[3:])
+                            except SystemExit as e:
+                                if e.code not in (None, 0):
+                                    raise InstallSystem.ErrorPythonRelated(f"PyInstaller exited with code {e.code}")
+                            finally:
+                                for handler in root_logger.handlers[:]:
+                                    if handler not in saved_handlers:
+                                        root_logger.removeHandler(handler)
+                                        handler.close()
+                                for handler in saved_handlers:
+                                    if handler not in root_logger.handlers:
+                                        root_logger.addHandler(handler)
+                                root_logger.setLevel(saved_level)
+                                sys.path[:] = saved_sys_path
+                        return FileSystem.check_file(path_output)
+                    # verbose/progress_callback: stream lines live into a bounded output tail, otherwise quiet
+                    env = {**os.environ, 'PYINSTALLER_CONFIG_DIR': config_dir} if config_dir else None
+                    if verbose or progress_callback is not None:
+                        cmd_ret: CmdSystem.Result = CmdSystem.run_live(cmd, raise_err=True, cumstem_env=env, on_line=progress_callback, log_output=verbose)
+                    else:
+                        cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=True, cumstem_env=env, quiet=True)
+                    if cmd_ret.is_success():  # 0 means no stderr
+                        return FileSystem.check_file(path_output)
                 
                 except Exception as e:
                     error_msg = f"Unexpected error building executable: {str(e)}"
@@ -1634,38 +2114,122 @@ class InstallSystem:
             else:
                 raise InstallSystem.ErrorPythonRelated(f"Target script for exe build not found: {path_script}") #exit_proper
 
+        """
+        @brief	Start build_exe_with_pyinstaller in the background and return its Future. build_exe_with_pyinstaller를 백그라운드에서 시작하고 Future를 반환합니다.
+        @param	args	    Positional arguments of build_exe_with_pyinstaller build_exe_with_pyinstaller의 위치 인자
+        @param	pool	    ThreadPoolSystem to submit to, None uses a shared lazily created pool that shutdown_build_pool drains at exit 제출할 ThreadPoolSystem, None이면 종료 시 shutdown_build_pool이 정리하는 공유 풀 사용 (Optional[ThreadPoolSystem])
+        @param	kwargs	    Keyword arguments of build_exe_with_pyinstaller build_exe_with_pyinstaller의 키워드 인자
+        @return	Future resolving to the build result (bool) 빌드 결과(bool)를 담는 Future
+        """
+        def build_exe_with_pyinstaller_async(*args, pool: Optional[ThreadPoolSystem] = None, **kwargs) -> Future:
+            # Concurrent builds must use distinct scripts or workpaths, dist/ in cwd is shared
+            # Each job gets its own PYINSTALLER_CONFIG_DIR unless one is given, so parallel runs never write the same
+            # cached binaries; this also makes every job a subprocess build instead of queueing on _pyi_run_lock
+            def job():
+                if kwargs.get('config_dir') is not None:
+                    return InstallSystem.PythonRelated.build_exe_with_pyinstaller(*args, **kwargs)
+                with tempfile.TemporaryDirectory(prefix='pyi-config-') as config_dir:
+                    return InstallSystem.PythonRelated.build_exe_with_pyinstaller(*args, **{**kwargs, 'config_dir': config_dir})
+            with InstallSystem.PythonRelated._build_pool_lock:
+                if pool is None:
+                    if InstallSystem.PythonRelated._build_pool is None:
+                        InstallSystem.PythonRelated._build_pool = ThreadPoolSystem() # cpu_count workers, PyInstaller runs are CPU-heavy
+                        # Registered after the pool's own destroy hook, so atexit (LIFO) cancels queued builds before that join
+                        atexit.register(InstallSystem.PythonRelated.shutdown_build_pool)
+                    pool = InstallSystem.PythonRelated._build_pool
+                future = pool.add_job(job)
+                InstallSystem.PythonRelated._build_futures.add(future)
+            future.add_done_callback(InstallSystem.PythonRelated._forget_build_future)
+            return future
+
+        def _forget_build_future(future: Future) -> None:
+            with InstallSystem.PythonRelated._build_pool_lock:
+                InstallSystem.PythonRelated._build_futures.discard(future)
+
+        """
+        @brief	Cancel queued async builds and wait for running ones to finish. 대기 중인 비동기 빌드를 취소하고 실행 중인 빌드가 끝날 때까지 기다립니다.
+        @return	None
+        """
+        def shutdown_build_pool() -> None:
+            # Runs at exit too: the pool's workers are daemon threads, joining them here keeps a running build
+            # from being cut off mid-write, and lets its TemporaryDirectory config_dir be removed
+            with InstallSystem.PythonRelated._build_pool_lock:
+                pool, InstallSystem.PythonRelated._build_pool = InstallSystem.PythonRelated._build_pool, None
+                pending = list(InstallSystem.PythonRelated._build_futures)
+            for future in pending:
+                future.cancel() # only succeeds for builds that have not started
+            if pool is not None:
+                pool.destroy()
+
 
         """
         @brief	Clean PyInstaller build artifacts. PyInstaller 빌드 아티팩트를 정리합니다.
-        @param	path_script	    Path to script (for finding .spec file) 스크립트 경로 (spec 파일 찾기용)
+        @param	path_script	    Path to script or list of scripts (for finding .spec files); build/dist are removed once for all 스크립트 경로 또는 목록 (spec 파일 찾기용), build/dist는 한 번만 제거
         @param	remove_dist	    Remove dist directory dist 디렉토리 제거
         @param	remove_build	Remove build directory build 디렉토리 제거
         @param	remove_spec	    Remove .spec file .spec 파일 제거
+        @param	background	    Rename directories aside and delete them in a background thread 디렉토리 이름을 바꾼 뒤 백그라운드 스레드에서 삭제
+        @param	remove_workpath	Also remove the scripts' persistent PyInstaller workpaths (needs path_script) 스크립트의 영구 PyInstaller 작업 디렉토리도 제거 (path_script 필요)
         @return	Tuple of (success: bool, message: str) (성공 여부, 메시지) 튜플
         """
         def clean_build_files_with_pyinstaller(
-                path_script: Optional[str] = None,
+                path_script: Optional[Union[str, List[str]]] = None,
                 remove_dist: bool = False,
                 remove_build: bool = True,
-                remove_spec: bool = False
+                remove_spec: bool = False,
+                background: bool = False,
+                remove_workpath: bool = False
             ) -> Tuple[bool, str]:
             try:
                 removed = []
+                failed = []
+                path_scripts = [path_script] if isinstance(path_script, str) else list(path_script or ())
                 
-                if remove_build and os.path.exists('build'):
-                    shutil.rmtree('build')
-                    removed.append('build')
-                
-                if remove_dist and os.path.exists('dist'):
-                    shutil.rmtree('dist')
-                    removed.append('dist')
+                # build/ and dist/ are independent trees of many small files, remove them concurrently
+                # EAFP: a missing directory surfaces as FileNotFoundError, no separate exists() stat
+                targets = [d for d, on in (('build', remove_build), ('dist', remove_dist)) if on]
+                # The persistent workpath is kept across builds unless explicitly requested
+                if remove_workpath:
+                    targets.extend(str(InstallSystem.PythonRelated.get_pyinstaller_workpath(p)) for p in path_scripts)
+                if background:
+                    # A rename is one metadata op, so the next build can start at once; non-daemon so exit waits for cleanup
+                    for d in targets:
+                        trash = f"{d}.trash-{os.getpid()}-{time.monotonic_ns()}"
+                        try:
+                            os.rename(d, trash)
+                        except FileNotFoundError:
+                            continue
+                        except OSError as e:
+                            failed.append(f"{d} ({e})")
+                            continue
+                        threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True}).start()
+                        removed.append(d)
+                elif targets:
+                    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+                        jobs = [(d, pool.submit(FileSystem.rmtree_fast, d)) for d in targets]
+                        for d, job in jobs:
+                            try:
+                                job.result()
+                                removed.append(d)
+                            except FileNotFoundError:
+                                pass
+                            except OSError as e:
+                                failed.append(f"{d} ({e})")
                 
-                if remove_spec and path_script:
-                    spec_file = f"{Path(path_script).stem}.spec"
-                    if os.path.exists(spec_file):
-                        os.remove(spec_file)
-                        removed.append(spec_file)
+                if remove_spec and path_scripts:
+                    # One scandir of cwd matches every script's .spec, instead of a remove attempt per script
+                    spec_files = {f"{Path(p).stem}.spec" for p in path_scripts}
+                    with os.scandir('.') as it:
+                        for entry in it:
+                            if entry.name in spec_files and entry.is_file(follow_symlinks=False):
+                                try:
+                                    os.remove(entry.path)
+                                    removed.append(entry.name)
+                                except FileNotFoundError:
+                                    pass
                 
+                if failed:
+                    return False, f"Error cleaning build files: {', '.join(failed)}"
                 if removed:
                     return True, f"Removed: {', '.join(removed)}"
                 else:
@@ -1677,8 +2241,8 @@ class InstallSystem:
         def install_pillow_lib_global(global_execute: bool = False) -> bool:
             try:
                 python_executable = "python" if global_execute else sys.executable    
-                cmd = [python_executable, "-m", "pip", "install", "pillow"]
-                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=True)
+                cmd = [python_executable, "-m", "pip", "install", "--disable-pip-version-check", "--prefer-binary", "pillow"]
+                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=True, quiet=True) # stdout unused, stderr tail kept on failure
                 if cmd_ret.is_success():
                     JLogger().log_info("Installed pillow successfully.")
                     return True
@@ -1693,8 +2257,8 @@ class InstallSystem:
                 FileSystem.ensure_installed('pillow', global_execute)
 
                 python_executable = "python" if global_execute else sys.executable    
-                cmd = [python_executable, "-m", "pip", "install", "google-genai"]
-                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=True)
+                cmd = [python_executable, "-m", "pip", "install", "--disable-pip-version-check", "--prefer-binary", "google-genai"]
+                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=True, quiet=True) # stdout unused, stderr tail kept on failure
                 if cmd_ret.is_success():
                     JLogger().log_info("Installed google-genai successfully.")
                     return True
@@ -1706,8 +2270,8 @@ class InstallSystem:
         def install_ollama_lib_global(global_execute: bool = False) -> bool:
             try:
                 python_executable = "python" if global_execute else sys.executable    
-                cmd = [python_executable, "-m", "pip", "install", "ollama"]
-                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=True)
+                cmd = [python_executable, "-m", "pip", "install", "--disable-pip-version-check", "--prefer-binary", "ollama"]
+                cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, raise_err=True, quiet=True) # stdout unused, stderr tail kept on failure
                 if cmd_ret.is_success():
                     JLogger().log_info("Installed ollama successfully.")
                     return True
@@ -1720,7 +2284,7 @@ class InstallSystem:
     class WingetRelated:
         def install_git_global(global_execute: bool = True) -> Optional[Path]:
             try:
-                if sys.platform == 'win32':
+                if _IS_WIN:
                     winapps_folder = FileSystem.get_path_windowsapps()
                     _success_winapps = EnvvarSystem.ensure_global_envvar("path_winapps", str(winapps_folder),  global_scope=False, permanent=True)
                     if not _success_winapps:
@@ -1753,7 +2317,7 @@ class InstallSystem:
                 if node_path:
                     JLogger().log_info(f"Node.js is already installed at: {node_path}")
                     return Path(node_path).parent
-                if sys.platform != 'win32':
+                if not _IS_WIN:
                     raise NotImplementedError("Node.js installation via winget is only implemented for Windows.")
                 cmd = [
                     'winget', 'install',
@@ -1781,7 +2345,7 @@ class InstallSystem:
                 if ollama_path:
                     JLogger().log_info(f"Ollama app is already installed at: {ollama_path}")
                     return Path(ollama_path).parent
-                if sys.platform != 'win32':
+                if not _IS_WIN:
                     raise NotImplementedError("Ollama app installation via winget is only implemented for Windows.")
  
                 cmd_install = [
@@ -2027,6 +2591,23 @@ class InstallSystem:
                 JLogger().log_error(f"Unexpected error deleting vcpkg: {str(e)}")
                 return False        
             
+"""
+@brief	Auto-install dispatch for FileSystem.ensure_installed. FileSystem.ensure_installed용 자동 설치 디스패치 테이블
+        {package_name(lower): (installer(global_execute) -> Optional[Path], need_envvar)}
+"""
+_AUTO_INSTALLERS: Dict[str, Tuple[Callable[[bool], Optional[Path]], bool]] = {
+    'git':           (lambda global_execute: InstallSystem.WingetRelated.install_git_global(global_execute), True),
+    'python':        (lambda global_execute: InstallSystem.PythonRelated.install_python_global(), True),
+    'pip':           (lambda global_execute: InstallSystem.PythonRelated.install_pip_global(global_execute, upgrade=True), False),
+    'pyinstaller':   (lambda global_execute: InstallSystem.PythonRelated.install_pyinstaller_global(global_execute, upgrade=True), False),
+    'pillow':        (lambda global_execute: InstallSystem.PythonRelated.install_pillow_lib_global(global_execute), False),
+    'google-gemini': (lambda global_execute: InstallSystem.PythonRelated.install_genai_lib_global(global_execute), False),
+    'ollama-lib':    (lambda global_execute: InstallSystem.PythonRelated.install_ollama_lib_global(global_execute), False),
+    'vcpkg':         (lambda global_execute: InstallSystem.VcpkgRelated.install_vcpkg_global(), True),
+    'nodejs':        (lambda global_execute: InstallSystem.WingetRelated.install_nodejs_global(), True),
+    'ollama':        (lambda global_execute: InstallSystem.WingetRelated.install_ollama_app_global(), True),
+}
+
 """
 @namespace environment variables
 @brief	Namespace for environment variable-related utilities. 환경 변수 관련 유틸리티를 위한 네임스페이스
@@ -2065,7 +2646,7 @@ class EnvvarSystem:
         @return	Dictionary of system environment variables 시스템 환경 변수 딕셔너리
         """
         dict_envvars = {}
-        if sys.platform == 'win32':
+        if _IS_WIN:
             cmd_query_global_envvar = [
                 'reg',
                 'query',
@@ -2094,7 +2675,7 @@ class EnvvarSystem:
 
     def get_global_env_keydict_by_path(path: str) -> Optional[Dict[str, None]]:    
         dict_env_keys = {}
-        if sys.platform == 'win32':
+        if _IS_WIN:
             cmd_query_global_envvar = [
                 'reg',
                 'query',
@@ -2127,7 +2708,7 @@ class EnvvarSystem:
         Refresh the current process's PATH environment variable from the Windows Registry.
         Also resolves unexpanded %VARIABLES% in PATH by loading them from registry if missing.
         """
-        if sys.platform != 'win32':
+        if not _IS_WIN:
             return False
 
         try:
@@ -2186,7 +2767,7 @@ class EnvvarSystem:
     #TODO: update_every_environ 통합
     def update_environ(scope, key, value = None) -> bool:
         try:
-            if sys.platform == 'win32':
+            if _IS_WIN:
                 cmd_query_global_envvar = [
                     'reg', 'query', scope,
                     '/v', # value
@@ -2220,7 +2801,7 @@ class EnvvarSystem:
         ) -> bool:
         try:        
             if permanent:
-                if sys.platform == 'win32':
+                if _IS_WIN:
                     scope = EnvvarSystem.USER_SCOPE if not global_scope else EnvvarSystem.GLOBAL_SCOPE
                     cmd_set_global_envvar = [
                         'reg', 'add', scope,
@@ -2248,7 +2829,7 @@ class EnvvarSystem:
         
     def clear_global_envvar_by_key_or_keylist(keys: Union[List[str], str], global_scope: bool = True, permanent: bool = True) -> bool:
         try:
-            if sys.platform != 'win32':
+            if not _IS_WIN:
                 raise ErrorEnvvarSystem("clear_global_envvar_by_key_or_keylist is only implemented for Windows.")
 
             if not permanent:
@@ -2286,7 +2867,7 @@ class EnvvarSystem:
 
     def ensure_global_envvar_to_Path(key: str, value: str, global_scope: bool = True, permanent: bool = True) -> bool:
         try:
-            if sys.platform == 'win32':
+            if _IS_WIN:
                 
                 # Get the current Path value
                 scope = EnvvarSystem.USER_SCOPE if not global_scope else EnvvarSystem.GLOBAL_SCOPE
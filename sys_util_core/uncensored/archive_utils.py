@@ -10,6 +10,7 @@ import zipfile
 import tarfile
 import os
 import shutil
+import fnmatch
 from typing import List, Optional
 
 
@@ -165,8 +166,6 @@ def compress_directory_to_zip(
 		output_zip: str,
 		exclude_patterns: Optional[List[str]] = None
  	) -> bool:
-    import fnmatch
-    
     try:
         with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
             for root, _, files in os.walk(directory):
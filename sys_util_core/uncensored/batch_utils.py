@@ -8,6 +8,8 @@ This module provides utility functions for batch processing files.
 
 import os
 import shutil
+import hashlib
+import zipfile
 from typing import List, Optional, Callable, Dict, Any
 from pathlib import Path
 import fnmatch
@@ -262,8 +264,6 @@ def organize_files_by_extension(source_dir: str, create_subdirs: bool = True) ->
 @return	Dictionary mapping hash to list of duplicate file paths 해시를 중복 파일 경로 리스트에 매핑한 딕셔너리
 """
 def find_duplicate_files(directory: str, extensions: Optional[List[str]] = None) -> Dict[str, List[str]]:
-    import hashlib
-    
     hash_map = {}
     duplicates = {}
     
@@ -311,8 +311,6 @@ def batch_compress_files(
 		extensions: List[str],
 		output_zip: str
  	) -> bool:
-    import zipfile
-    
     try:
         with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
             for filename in os.listdir(directory):
@@ -10,6 +10,7 @@ Note: Excel functions require openpyxl package for .xlsx files
 """
 
 import csv
+import json
 import os
 from typing import List, Dict, Any, Optional, Union
 
@@ -225,8 +226,6 @@ def convert_csv_to_json(
 		json_path: Optional[str] = None,
 		encoding: str = 'utf-8'
  	) -> Optional[List[Dict[str, str]]]:
-    import json
-    
     try:
         data = read_csv_as_dict(csv_path, encoding=encoding)
         
@@ -6,14 +6,63 @@ This module provides utility functions for network operations.
 네트워크 작업을 위한 유틸리티 함수들을 제공합니다.
 """
 
+import platform
+import re
 import socket
 import subprocess
 import time
-from typing import Optional, Tuple
+import urllib.request
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from sys_util_core.jsystems import CmdSystem, JLogger
 
 
+# Resolved once at import; the platform does not change at runtime
+_IS_WIN: bool = platform.system().lower() == 'windows'
+
+# Ping output patterns, compiled once instead of per call
+_PING_WIN = re.compile(r'Average = (\d+)ms', re.ASCII)
+_PING_NIX = re.compile(r'avg[^=]*=\s*([0-9.]+)', re.ASCII)
+
+# Minimal DNS query (A record for example.com) used as a connectivity probe
+_DNS_PROBE_QUERY = b'\x00\x00\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x07example\x03com\x00\x00\x01\x00\x01'
+
+# Entry bound of each _ttl cache, for callers passing many distinct arguments
+_CACHE_MAX_ENTRIES = 256
+
+
+"""
+@brief	Decorator caching a function result for a short time. 함수 결과를 짧은 시간 동안 캐시하는 데코레이터입니다.
+@param	seconds	Time-to-live of cached value in seconds 캐시 값의 유효 시간 (초)
+@return	Decorator with a per-function cache keyed by arguments 인자를 키로 하는 함수별 캐시를 가진 데코레이터
+"""
+def _ttl(seconds: float) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        # {(args, kwargs): (timestamp, value)}, in insertion order so the oldest timestamp comes first
+        cache: Dict[tuple, Tuple[float, Any]] = {}
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None:
+                if (now - hit[0]) < seconds:
+                    return hit[1]
+                del cache[key]
+            value = func(*args, **kwargs)
+            # Full: purge every expired entry first, evict live ones (oldest first) only if still over the bound
+            if len(cache) >= _CACHE_MAX_ENTRIES:
+                for stale in [k for k, (stamp, _) in cache.items() if (now - stamp) >= seconds]:
+                    del cache[stale]
+                while len(cache) >= _CACHE_MAX_ENTRIES:
+                    del cache[next(iter(cache))]
+            cache[key] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+
 """
 @brief	Check if a port is open on a host. 호스트의 포트가 열려있는지 확인합니다.
 @param	host	Host address 호스트 주소
@@ -43,10 +92,7 @@ def check_port_open(
 @return	Tuple of (success, average_time_ms) (성공 여부, 평균 시간 ms) 튜플
 """
 def ping_host(host: str, count: int = 4) -> Tuple[bool, float]:
-    import platform
-    import re
-    
-    param = '-n' if platform.system().lower() == 'windows' else '-c'
+    param = '-n' if _IS_WIN else '-c'
     command = ['ping', param, str(count), host]
     
     try:
@@ -56,10 +102,7 @@ def ping_host(host: str, count: int = 4) -> Tuple[bool, float]:
             raise Exception("Ping command failed")
             
         # Extract average time from output
-        if platform.system().lower() == 'windows':
-            match = re.search(r'Average = (\d+)ms', cmd_ret.stdout)
-        else:
-            match = re.search(r'avg[^=]*=\s*([0-9.]+)', cmd_ret.stdout)
+        match = (_PING_WIN if _IS_WIN else _PING_NIX).search(cmd_ret.stdout)
         
         return True, float(match.group(1)) if match else 0.0
         
@@ -72,6 +115,7 @@ def ping_host(host: str, count: int = 4) -> Tuple[bool, float]:
 @brief	Get local IP address. 로컬 IP 주소를 가져옵니다.
 @return	Local IP address or None if error 로컬 IP 주소, 에러시 None
 """
+@_ttl(5.0)
 def get_local_ip() -> Optional[str]:
     try:
         # Create a socket and connect to external server
@@ -88,6 +132,7 @@ def get_local_ip() -> Optional[str]:
 @brief	Get system hostname. 시스템 호스트명을 가져옵니다.
 @return	Hostname or None if error 호스트명, 에러시 None
 """
+@_ttl(5.0)
 def get_hostname() -> Optional[str]:
     try:
         return socket.gethostname()
@@ -125,8 +170,17 @@ def get_reverse_dns(ip_address: str) -> Optional[str]:
 @param	timeout	    Connection timeout in seconds 연결 타임아웃 (초)
 @return	True if connected, False otherwise 연결되면 True, 아니면 False
 """
+@_ttl(5.0)
 def check_internet_connection(test_host: str = '8.8.8.8', timeout: float = 3.0) -> bool:
-    return check_port_open(test_host, 53, timeout)
+    # Single UDP DNS query instead of a TCP handshake on port 53
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(timeout)
+            sock.sendto(_DNS_PROBE_QUERY, (test_host, 53))
+            sock.recvfrom(512)
+        return True
+    except OSError:
+        return False
 
 
 """
@@ -158,19 +212,25 @@ def scan_ports(
 """
 def measure_download_speed(url: str = 'http://speedtest.tele2.net/1MB.zip',
                            timeout: int = 30) -> Optional[float]:
-    import urllib.request
-    
     try:
-        start_time = time.time()
+        # identity encoding so gzip does not skew the measured throughput
+        request = urllib.request.Request(url, headers={'Accept-Encoding': 'identity'})
+        total_bytes = 0
+        start_time = time.perf_counter()
         
-        with urllib.request.urlopen(url, timeout=timeout) as response:
-            data = response.read()
+        # Stream in fixed chunks and only count bytes, payload is discarded
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            while True:
+                chunk = response.read(65536)
+                if not chunk:
+                    break
+                total_bytes += len(chunk)
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # Calculate speed
         duration = end_time - start_time
-        size_mb = len(data) / (1024 * 1024)
+        size_mb = total_bytes / (1024 * 1024)
         speed_mbps = (size_mb * 8) / duration
         
         return round(speed_mbps, 2)
@@ -183,12 +243,10 @@ def measure_download_speed(url: str = 'http://speedtest.tele2.net/1MB.zip',
 @return	Dictionary with interface information 인터페이스 정보 딕셔너리
 """
 def get_network_interfaces() -> dict:
-    import platform
-    
     interfaces = {}
     
     try:
-        cmd = ['ipconfig', '/all'] if platform.system().lower() == 'windows' else ['ifconfig']
+        cmd = ['ipconfig', '/all'] if _IS_WIN else ['ifconfig']
         cmd_ret: CmdSystem.Result = CmdSystem.run(cmd)
         if cmd_ret.is_error():
             raise Exception("Failed to get network interfaces")
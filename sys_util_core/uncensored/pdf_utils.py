@@ -12,14 +12,120 @@ Note: Some functions require external packages (pillow, reportlab, python-docx,
 > python -m pip install --upgrade pillow
 > python -m pip install --upgrade reportlab
 > python -m pip install --upgrade pywin32
+> python -m pip install --upgrade pikepdf (optional, JPEG pass-through)
 """
 
 import os
-from typing import List, Optional
+import struct
+import sys
+import subprocess
+from typing import List, Optional, Tuple
 
 from sys_util_core.jsystems import CmdSystem, JLogger
 
 
+# PIL.Image module, bound on first use (optional dependency)
+_Image = None
+
+
+"""
+@brief	Import PIL.Image once and reuse the module afterwards. PIL.Image를 한 번만 임포트하고 이후 재사용합니다.
+@return	PIL.Image module PIL.Image 모듈
+"""
+def _get_pil_image():
+    global _Image
+    if _Image is None:
+        from PIL import Image
+        _Image = Image
+    return _Image
+
+
+# JPEG SOF markers carrying frame size (excludes DHT/JPG/DAC: C4, C8, CC)
+_JPEG_SOF_MARKERS = frozenset((0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF))
+_JPEG_COLOR_SPACES = {1: '/DeviceGray', 3: '/DeviceRGB'}
+
+
+"""
+@brief	Read frame size, component count and sample precision from JPEG SOF marker. JPEG SOF 마커에서 크기, 컴포넌트 수, 샘플 정밀도를 읽습니다.
+@param	data	Raw JPEG bytes JPEG 원본 바이트
+@return	Tuple of (width, height, components, precision) or None if not found (너비, 높이, 컴포넌트 수, 정밀도) 튜플, 없으면 None
+"""
+def _read_jpeg_header(data: bytes) -> Optional[Tuple[int, int, int, int]]:
+    if not data.startswith(b'\xff\xd8\xff'):
+        return None
+    
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF: # fill byte
+            pos += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7: # markers without length
+            pos += 2
+            continue
+        
+        seg_len = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+        if marker in _JPEG_SOF_MARKERS:
+            if pos + 10 > len(data):
+                return None
+            precision, height, width, components = struct.unpack('>BHHB', data[pos + 4:pos + 10])
+            return width, height, components, precision
+        pos += 2 + seg_len
+    return None
+
+
+"""
+@brief	Wrap a JPEG file into a single-page PDF without re-encoding. JPEG 파일을 재인코딩 없이 단일 페이지 PDF로 감쌉니다.
+@param	image_path	Path to image file 이미지 파일 경로
+@param	output_pdf	Output PDF file path 출력 PDF 파일 경로
+@return	True if written, False if input is not a plain JPEG or pikepdf is unavailable 작성되면 True, 일반 JPEG가 아니거나 pikepdf가 없으면 False
+"""
+def _jpeg_to_pdf(image_path: str, output_pdf: str) -> bool:
+    try:
+        import pikepdf
+    except ImportError:
+        return False
+    
+    with open(image_path, 'rb') as f:
+        # SOI check on a 3-byte read, non-JPEG inputs are never loaded whole
+        data = f.read(3)
+        if data != b'\xff\xd8\xff':
+            return False
+        data += f.read()
+    
+    header = _read_jpeg_header(data)
+    # CMYK etc. go through PIL; PDF's DCTDecode only defines 8-bit samples, 12-bit JPEG too
+    if header is None or header[2] not in _JPEG_COLOR_SPACES or header[3] != 8:
+        return False
+    width, height, components, precision = header
+    
+    pdf = pikepdf.new()
+    image = pikepdf.Stream(pdf, data)
+    image.Type = pikepdf.Name.XObject
+    image.Subtype = pikepdf.Name.Image
+    image.Filter = pikepdf.Name.DCTDecode
+    image.Width = width
+    image.Height = height
+    image.ColorSpace = pikepdf.Name(_JPEG_COLOR_SPACES[components])
+    image.BitsPerComponent = precision
+    
+    # Same page size as the PIL path (resolution=100.0)
+    page_w = width * 72.0 / 100.0
+    page_h = height * 72.0 / 100.0
+    content = f"q {page_w:.4f} 0 0 {page_h:.4f} 0 0 cm /Im0 Do Q".encode('ascii')
+    page = pikepdf.Dictionary(
+        Type=pikepdf.Name.Page,
+        MediaBox=[0, 0, page_w, page_h],
+        Resources=pikepdf.Dictionary(XObject=pikepdf.Dictionary(Im0=image)),
+        Contents=pikepdf.Stream(pdf, content),
+    )
+    pdf.pages.append(pikepdf.Page(page))
+    pdf.save(output_pdf)
+    return True
+
+
 """
 @brief	Convert image file to PDF. 이미지 파일을 PDF로 변환합니다.
 @param	image_path	Path to image file 이미지 파일 경로
@@ -28,7 +134,15 @@ from sys_util_core.jsystems import CmdSystem, JLogger
 """
 def image_to_pdf(image_path: str, output_pdf: str) -> bool:
     try:
-        from PIL import Image
+        # Fast path: embed JPEG bytes as-is (DCTDecode), no decode/re-encode
+        try:
+            if _jpeg_to_pdf(image_path, output_pdf):
+                return True
+        except Exception as e:
+            # Malformed JPEG or pikepdf failure: the PIL path below still produces the PDF
+            JLogger().log_warning(f"JPEG pass-through failed, re-encoding with PIL: {e}")
+        
+        Image = _get_pil_image()
         
         image = Image.open(image_path)
         
@@ -50,7 +164,7 @@ def image_to_pdf(image_path: str, output_pdf: str) -> bool:
 """
 def images_to_pdf(image_paths: List[str], output_pdf: str) -> bool:
     try:
-        from PIL import Image
+        Image = _get_pil_image()
         
         images = []
         
@@ -91,19 +205,30 @@ def text_to_pdf(
         
         c = canvas.Canvas(output_pdf, pagesize=letter)
         width, height = letter
+        leading = font_size + 4
+        
+        # One text object (single BT/ET block) per page instead of drawString per line
+        def _begin_page_text():
+            text_obj = c.beginText(inch, height - inch)
+            text_obj.setFont(font_name, font_size)
+            text_obj.setLeading(leading)
+            return text_obj
         
         y = height - inch
+        text_obj = _begin_page_text()
         lines = text.split('\n')
         
         for line in lines:
             if y < inch:
+                c.drawText(text_obj)
                 c.showPage()
                 y = height - inch
+                text_obj = _begin_page_text()
             
-            c.setFont(font_name, font_size)
-            c.drawString(inch, y, line)
-            y -= font_size + 4
+            text_obj.textLine(line)
+            y -= leading
         
+        c.drawText(text_obj)
         c.save()
         return True
     except Exception:
@@ -119,9 +244,6 @@ def text_to_pdf(
 """
 def word_to_pdf(docx_path: str, output_pdf: str) -> bool:
     try:
-        import sys
-        import subprocess
-        
         if sys.platform == 'win32':
             # Try using Word COM automation on Windows
             import win32com.client            
@@ -159,9 +281,6 @@ def word_to_pdf(docx_path: str, output_pdf: str) -> bool:
 """
 def excel_to_pdf(excel_path: str, output_pdf: str) -> bool:
     try:
-        import sys
-        import subprocess
-        
         if sys.platform == 'win32':
             import win32com.client            
             excel = win32com.client.Dispatch('Excel.Application')
@@ -196,9 +315,6 @@ def excel_to_pdf(excel_path: str, output_pdf: str) -> bool:
 """
 def powerpoint_to_pdf(pptx_path: str, output_pdf: str) -> bool:
     try:
-        import sys
-        import subprocess
-        
         if sys.platform == 'win32':
             import win32com.client                
             powerpoint = win32com.client.Dispatch('PowerPoint.Application')
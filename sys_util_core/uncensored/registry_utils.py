@@ -10,7 +10,12 @@ Windows 레지스트리 작업을 위한 유틸리티 함수들을 제공합니
 """
 
 import sys
-from typing import Optional, List, Tuple, Any
+import ctypes
+import atexit
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, List, Tuple, Any, Callable
 
 from sys_util_core.jsystems import CmdSystem, JLogger
 
@@ -18,8 +23,132 @@ from sys_util_core.jsystems import CmdSystem, JLogger
 # Check if winreg is available (Windows only)
 if sys.platform == 'win32':
     import winreg
+    # Type code to name map, built once instead of per get_registry_type_name call
+    _REG_TYPE_NAMES = {
+        winreg.REG_BINARY: "REG_BINARY",
+        winreg.REG_DWORD: "REG_DWORD",
+        winreg.REG_DWORD_LITTLE_ENDIAN: "REG_DWORD_LITTLE_ENDIAN",
+        winreg.REG_DWORD_BIG_ENDIAN: "REG_DWORD_BIG_ENDIAN",
+        winreg.REG_EXPAND_SZ: "REG_EXPAND_SZ",
+        winreg.REG_LINK: "REG_LINK",
+        winreg.REG_MULTI_SZ: "REG_MULTI_SZ",
+        winreg.REG_NONE: "REG_NONE",
+        winreg.REG_SZ: "REG_SZ",
+    }
 else:
     winreg = None
+    _REG_TYPE_NAMES = {}
+
+# RegNotifyChangeKeyValue filter flags (winnt.h)
+_REG_NOTIFY_CHANGE_NAME = 0x00000001
+_REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+_WAIT_OBJECT_0 = 0x00000000
+_INFINITE = 0xFFFFFFFF
+
+# Open key handles reused across calls: {(root_key, lowercased key_path, access): entry}, least recently used first
+# entry = [handle, users, dropped]; a dropped handle is closed by its last user instead of under another thread
+_KEY_CACHE_SIZE = 64
+_key_cache: OrderedDict = OrderedDict()
+_key_cache_lock = threading.Lock()
+
+
+"""
+@brief	Drop a cache entry, closing its handle now or when its last user releases it. 캐시 항목을 제거하고, 핸들을 지금 또는 마지막 사용자가 반환할 때 닫습니다.
+@param	entry	Cache entry [handle, users, dropped] 캐시 항목 [핸들, 사용자 수, 제거 여부]
+"""
+def _drop_entry(entry: list) -> None:
+    entry[2] = True
+    if entry[1] == 0:
+        entry[0].Close()
+
+
+"""
+@brief	Borrow an open registry key handle, reusing a cached one when possible. 열린 레지스트리 키 핸들을 빌려오며, 가능하면 캐시된 핸들을 재사용합니다.
+@param	root_key	Root registry key 루트 레지스트리 키
+@param	key_path	Registry key path 레지스트리 키 경로
+@param	access	    Access mask 접근 권한
+@param	create	    Create the key if it does not exist 키가 없으면 생성
+@return	Context manager yielding a key handle owned by the cache 캐시가 소유하는 키 핸들을 내주는 컨텍스트 매니저
+"""
+@contextmanager
+def _borrow_key(root_key, key_path: str, access: int, create: bool = False):
+    # Registry paths are case-insensitive
+    cache_key = (root_key, key_path.lower(), access)
+    with _key_cache_lock:
+        entry = _key_cache.get(cache_key)
+        if entry is not None:
+            _key_cache.move_to_end(cache_key)
+            entry[1] += 1
+    
+    if entry is None:
+        key = winreg.CreateKeyEx(root_key, key_path, 0, access) if create else winreg.OpenKey(root_key, key_path, 0, access)
+        with _key_cache_lock:
+            entry = _key_cache.get(cache_key)
+            if entry is not None:
+                # Another thread opened the same key meanwhile, keep one handle
+                key.Close()
+                _key_cache.move_to_end(cache_key)
+                entry[1] += 1
+            else:
+                entry = [key, 1, False]
+                _key_cache[cache_key] = entry
+                while len(_key_cache) > _KEY_CACHE_SIZE:
+                    _drop_entry(_key_cache.popitem(last=False)[1])
+    
+    try:
+        yield entry[0]
+    finally:
+        with _key_cache_lock:
+            entry[1] -= 1
+            if entry[2] and entry[1] == 0:
+                entry[0].Close()
+
+
+"""
+@brief	Run an operation on a cached key handle, reopening once if the handle went stale. 캐시된 키 핸들로 작업을 실행하며, 핸들이 무효화되면 한 번 다시 엽니다.
+@param	root_key	Root registry key 루트 레지스트리 키
+@param	key_path	Registry key path 레지스트리 키 경로
+@param	access	    Access mask 접근 권한
+@param	operation	Callable taking the key handle 키 핸들을 받는 호출 가능 객체
+@param	create	    Create the key if it does not exist 키가 없으면 생성
+@return	Result of operation 작업 결과
+"""
+def _with_key(root_key, key_path: str, access: int, operation: Callable, create: bool = False) -> Any:
+    try:
+        with _borrow_key(root_key, key_path, access, create) as key:
+            return operation(key)
+    except FileNotFoundError:
+        # Missing value on a live handle, a reopen would not change the answer
+        raise
+    except OSError:
+        # The cached handle may belong to a key deleted (and maybe recreated) elsewhere
+        _forget_keys(root_key, key_path)
+    with _borrow_key(root_key, key_path, access, create) as key:
+        return operation(key)
+
+
+"""
+@brief	Drop cached handles of a key and its subkeys. 키와 하위 키의 캐시된 핸들을 제거합니다.
+@param	root_key	Root registry key 루트 레지스트리 키
+@param	key_path	Registry key path 레지스트리 키 경로
+"""
+def _forget_keys(root_key, key_path: str) -> None:
+    path = key_path.lower()
+    with _key_cache_lock:
+        for cache_key in [k for k in _key_cache if k[0] == root_key and (k[1] == path or k[1].startswith(path + '\\'))]:
+            _drop_entry(_key_cache.pop(cache_key))
+
+
+"""
+@brief	Close every cached registry key handle not currently in use. 사용 중이 아닌 캐시된 모든 레지스트리 키 핸들을 닫습니다.
+"""
+def close_registry_handles() -> None:
+    with _key_cache_lock:
+        while _key_cache:
+            _drop_entry(_key_cache.popitem()[1])
+
+
+atexit.register(close_registry_handles)
 
 
 """
@@ -49,9 +178,8 @@ def get_registry_value(
         root_key = winreg.HKEY_CURRENT_USER
     
     try:
-        key = winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ)
-        value, _ = winreg.QueryValueEx(key, value_name)
-        winreg.CloseKey(key)
+        # Cached handle: repeated reads of the same key skip the OpenKey/CloseKey pair
+        value, _ = _with_key(root_key, key_path, winreg.KEY_READ, lambda key: winreg.QueryValueEx(key, value_name))
         return value
     except Exception:
         return None
@@ -83,9 +211,7 @@ def set_registry_value(
         value_type = winreg.REG_SZ
     
     try:
-        key = winreg.CreateKey(root_key, key_path)
-        winreg.SetValueEx(key, value_name, 0, value_type, value)
-        winreg.CloseKey(key)
+        _with_key(root_key, key_path, winreg.KEY_WRITE, lambda key: winreg.SetValueEx(key, value_name, 0, value_type, value), create=True)
         return True
     except Exception:
         return False
@@ -110,9 +236,7 @@ def delete_registry_value(
         root_key = winreg.HKEY_CURRENT_USER
     
     try:
-        key = winreg.OpenKey(root_key, key_path, 0, winreg.KEY_WRITE)
-        winreg.DeleteValue(key, value_name)
-        winreg.CloseKey(key)
+        _with_key(root_key, key_path, winreg.KEY_WRITE, lambda key: winreg.DeleteValue(key, value_name))
         return True
     except Exception:
         return False
@@ -153,6 +277,8 @@ def delete_registry_key(key_path: str, root_key=None) -> bool:
         root_key = winreg.HKEY_CURRENT_USER
     
     try:
+        # Handles of the deleted key would only fail from now on
+        _forget_keys(root_key, key_path)
         winreg.DeleteKey(root_key, key_path)
         return True
     except Exception:
@@ -173,6 +299,7 @@ def registry_key_exists(key_path: str, root_key=None) -> bool:
         root_key = winreg.HKEY_CURRENT_USER
     
     try:
+        # Deliberately not cached: a cached handle would keep answering True after the key is deleted elsewhere
         key = winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ)
         winreg.CloseKey(key)
         return True
@@ -196,16 +323,10 @@ def list_registry_subkeys(key_path: str, root_key=None) -> List[str]:
     subkeys = []
     
     try:
-        key = winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ)
-        i = 0
-        while True:
-            try:
-                subkey_name = winreg.EnumKey(key, i)
-                subkeys.append(subkey_name)
-                i += 1
-            except OSError:
-                break
-        winreg.CloseKey(key)
+        # QueryInfoKey gives the exact count, no OSError raised to detect the end; the handle closes on exit
+        with winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ) as key:
+            n_subkeys = winreg.QueryInfoKey(key)[0]
+            subkeys = [winreg.EnumKey(key, i) for i in range(n_subkeys)]
     except Exception:
         pass
     
@@ -228,16 +349,8 @@ def list_registry_values(key_path: str, root_key=None) -> List[Tuple[str, Any, i
     values = []
     
     try:
-        key = winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ)
-        i = 0
-        while True:
-            try:
-                value_tuple = winreg.EnumValue(key, i)
-                values.append(value_tuple)
-                i += 1
-            except OSError:
-                break
-        winreg.CloseKey(key)
+        # QueryInfoKey gives the exact count, no OSError raised to detect the end; the handle stays cached
+        values = _with_key(root_key, key_path, winreg.KEY_READ, lambda key: [winreg.EnumValue(key, i) for i in range(winreg.QueryInfoKey(key)[1])])
     except Exception:
         pass
     
@@ -250,22 +363,57 @@ def list_registry_values(key_path: str, root_key=None) -> List[Tuple[str, Any, i
 @return	Type name as string 문자열로 된 타입 이름
 """
 def get_registry_type_name(type_code: int) -> str:
-    if not is_windows() or winreg is None:
-        return "UNKNOWN"
-    
-    type_names = {
-        winreg.REG_BINARY: "REG_BINARY",
-        winreg.REG_DWORD: "REG_DWORD",
-        winreg.REG_DWORD_LITTLE_ENDIAN: "REG_DWORD_LITTLE_ENDIAN",
-        winreg.REG_DWORD_BIG_ENDIAN: "REG_DWORD_BIG_ENDIAN",
-        winreg.REG_EXPAND_SZ: "REG_EXPAND_SZ",
-        winreg.REG_LINK: "REG_LINK",
-        winreg.REG_MULTI_SZ: "REG_MULTI_SZ",
-        winreg.REG_NONE: "REG_NONE",
-        winreg.REG_SZ: "REG_SZ",
-    }
-    
-    return type_names.get(type_code, "UNKNOWN")
+    # Empty map off Windows, so every code is UNKNOWN there
+    return _REG_TYPE_NAMES.get(type_code, "UNKNOWN")
+
+
+"""
+@brief	Format one registry value as a .reg file data field. 레지스트리 값 하나를 .reg 파일 데이터 형식으로 변환합니다.
+@param	data	    Value data as returned by winreg.EnumValue winreg.EnumValue가 반환한 값 데이터
+@param	value_type	Registry value type 레지스트리 값 타입
+@return	Data part of a '"name"=data' line '"이름"=데이터' 줄의 데이터 부분
+"""
+def _format_reg_data(data: Any, value_type: int) -> str:
+    if value_type == winreg.REG_SZ:
+        return '"' + (data or '').replace('\\', '\\\\').replace('"', '\\"') + '"'
+    if value_type == winreg.REG_DWORD:
+        return f"dword:{(data or 0) & 0xFFFFFFFF:08x}"
+    if value_type == winreg.REG_BINARY:
+        return "hex:" + ','.join(f"{b:02x}" for b in (data or b''))
+    # Remaining types are written as typed hex, the same way reg.exe and regedit export them
+    if value_type == winreg.REG_EXPAND_SZ:
+        raw = ((data or '') + '\0').encode('utf-16-le')
+    elif value_type == winreg.REG_MULTI_SZ:
+        raw = ''.join(item + '\0' for item in (data or [])).encode('utf-16-le') + b'\0\0'
+    elif value_type == winreg.REG_QWORD:
+        raw = (data or 0).to_bytes(8, 'little')
+    elif isinstance(data, bytes):
+        raw = data
+    else:
+        raw = b''
+    return f"hex({value_type:x}):" + ','.join(f"{b:02x}" for b in raw)
+
+
+"""
+@brief	Write a registry key and its subkeys in .reg format. 레지스트리 키와 하위 키를 .reg 형식으로 씁니다.
+@param	out	        Text stream to write to 쓸 텍스트 스트림
+@param	root_key	Root registry key 루트 레지스트리 키
+@param	root_name	Full name of the root key (e.g., 'HKEY_CURRENT_USER') 루트 키의 전체 이름 (예: 'HKEY_CURRENT_USER')
+@param	key_path	Registry key path 레지스트리 키 경로
+"""
+def _write_reg_key(out, root_key, root_name: str, key_path: str) -> None:
+    with winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ) as key:
+        n_subkeys, n_values, _ = winreg.QueryInfoKey(key)
+        out.write(f"[{root_name}\\{key_path}]\r\n")
+        for i in range(n_values):
+            name, data, value_type = winreg.EnumValue(key, i)
+            field = '@' if name == '' else '"' + name.replace('\\', '\\\\').replace('"', '\\"') + '"'
+            out.write(f"{field}={_format_reg_data(data, value_type)}\r\n")
+        out.write("\r\n")
+        subkeys = [winreg.EnumKey(key, i) for i in range(n_subkeys)]
+    # Parent handle is closed before descending, so at most one key handle is open at a time
+    for subkey in subkeys:
+        _write_reg_key(out, root_key, root_name, f"{key_path}\\{subkey}")
 
 
 """
@@ -285,18 +433,28 @@ def export_registry_key(
     
     try:        
         root_names = {
-            winreg.HKEY_CURRENT_USER: "HKCU",
-            winreg.HKEY_LOCAL_MACHINE: "HKLM",
-            winreg.HKEY_CLASSES_ROOT: "HKCR",
-            winreg.HKEY_USERS: "HKU",
-            winreg.HKEY_CURRENT_CONFIG: "HKCC",
+            winreg.HKEY_CURRENT_USER: ("HKCU", "HKEY_CURRENT_USER"),
+            winreg.HKEY_LOCAL_MACHINE: ("HKLM", "HKEY_LOCAL_MACHINE"),
+            winreg.HKEY_CLASSES_ROOT: ("HKCR", "HKEY_CLASSES_ROOT"),
+            winreg.HKEY_USERS: ("HKU", "HKEY_USERS"),
+            winreg.HKEY_CURRENT_CONFIG: ("HKCC", "HKEY_CURRENT_CONFIG"),
         }
         
         if root_key is None:
             root_key = winreg.HKEY_CURRENT_USER        
-        root_name = root_names.get(root_key, "HKCU")
-        full_path = f"{root_name}\\{key_path}"
+        root_name, root_full_name = root_names.get(root_key, ("HKCU", "HKEY_CURRENT_USER"))
+        
+        # In-process export through winreg, no reg.exe process; UTF-16 LE with BOM as regedit writes it
+        try:
+            with open(output_file, 'w', encoding='utf-16-le', newline='') as out:
+                out.write("\ufeffWindows Registry Editor Version 5.00\r\n\r\n")
+                _write_reg_key(out, root_key, root_full_name, key_path)
+            return True
+        except OSError as e:
+            # e.g. a subkey the current user cannot read: let reg.exe try with its own access handling
+            JLogger().log_info(f"In-process registry export failed, falling back to reg.exe: {e}")
         
+        full_path = f"{root_name}\\{key_path}"
         cmd_ret: CmdSystem.Result = CmdSystem.run(['reg', 'export', full_path, output_file, '/y'])
         if cmd_ret.is_error():
             raise Exception(cmd_ret.stderr)
@@ -304,3 +462,60 @@ def export_registry_key(
     except Exception as e:
         JLogger().log_error(f"Registry export failed: {e}")
         return False
+
+
+"""
+@brief	Block until a registry key changes instead of polling it. 레지스트리 키를 폴링하지 않고 변경될 때까지 대기합니다.
+@param	key_path	    Registry key path to watch 감시할 레지스트리 키 경로
+@param	root_key	    Root registry key (default: HKEY_CURRENT_USER) 루트 레지스트리 키 (기본값: HKEY_CURRENT_USER)
+@param	timeout	        Maximum wait in seconds, None waits forever 최대 대기 시간 (초), None이면 무기한 대기
+@param	watch_subtree	Also report changes in subkeys 하위 키의 변경도 감지
+@return	True if the key changed, False on timeout or error 키가 변경되면 True, 타임아웃이나 에러시 False
+"""
+def wait_for_registry_change(
+		key_path: str,
+		root_key=None,
+		timeout: Optional[float] = None,
+		watch_subtree: bool = True
+ 	) -> bool:
+    if not is_windows() or winreg is None:
+        return False
+    
+    if root_key is None:
+        root_key = winreg.HKEY_CURRENT_USER
+    
+    try:
+        from ctypes import wintypes
+        # Private DLL instances, so the argtypes set here do not leak into other ctypes.windll users
+        advapi32 = ctypes.WinDLL('advapi32')
+        kernel32 = ctypes.WinDLL('kernel32')
+        advapi32.RegNotifyChangeKeyValue.argtypes = [wintypes.HKEY, wintypes.BOOL, wintypes.DWORD, wintypes.HANDLE, wintypes.BOOL]
+        advapi32.RegNotifyChangeKeyValue.restype = wintypes.LONG
+        kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        
+        with winreg.OpenKey(root_key, key_path, 0, winreg.KEY_NOTIFY) as key:
+            event = kernel32.CreateEventW(None, False, False, None)
+            if not event:
+                return False
+            try:
+                rc = advapi32.RegNotifyChangeKeyValue(
+                    key.handle,
+                    watch_subtree,
+                    _REG_NOTIFY_CHANGE_NAME | _REG_NOTIFY_CHANGE_LAST_SET,
+                    event,
+                    True
+                )
+                if rc != 0:
+                    return False
+                # The thread sleeps in the kernel until the key changes or the timeout expires
+                wait_ms = _INFINITE if timeout is None else int(timeout * 1000)
+                return kernel32.WaitForSingleObject(event, wait_ms) == _WAIT_OBJECT_0
+            finally:
+                kernel32.CloseHandle(event)
+    except Exception as e:
+        JLogger().log_error(f"Registry watch failed: {e}")
+        return False
@@ -8,12 +8,16 @@ This module provides utility functions for managing Python virtual environments
 
 import os
 import sys
+import glob
+import shutil
 import subprocess
 import json
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
-from sys_util_core.jsystems import CmdSystem, JLogger
+from sys_util_core.jsystems import CmdSystem, FileSystem, JErrorSystem, JLogger
 
 """
 @brief	Exception raised for virtual environment operations. 가상 환경 작업 중 발생하는 예외
@@ -21,6 +25,79 @@ from sys_util_core.jsystems import CmdSystem, JLogger
 class VenvError(JErrorSystem): pass
 
 
+# Platform layout of venv executables, resolved once
+_IS_WIN = sys.platform == 'win32'
+_VENV_BIN_DIR = 'Scripts' if _IS_WIN else 'bin'
+_EXE_SUFFIX = '.exe' if _IS_WIN else ''
+
+# Found venv executables: {(abs venv_path, name): path}, only hits are cached
+_VENV_EXE_CACHE: Dict[Tuple[str, str], str] = {}
+
+# (abs venv_path, requested version) pairs already ensured by ensure_pyinstaller this session
+_VENV_PYI_ENSURED: set = set()
+
+# site-packages directory of each venv: {abs venv_path: path}
+_VENV_SITE_CACHE: Dict[str, str] = {}
+
+# Probed package versions: {(abs venv_path, package): (site-packages mtime_ns, version)}
+# Installing or removing a distribution adds/removes a *.dist-info entry, which bumps the directory mtime
+_VENV_PKG_VERSION_CACHE: Dict[Tuple[str, str], Tuple[int, Optional[str]]] = {}
+
+
+"""
+@brief Locate an executable inside a virtual environment, caching hits. 가상 환경 안의 실행 파일을 찾고 결과를 캐시합니다.
+@param venv_path    Path to virtual environment 가상 환경 경로
+@param name         Executable name without suffix (e.g., 'python', 'pip') 확장자 없는 실행 파일 이름
+@return Path to executable or None if not found 실행 파일 경로 또는 None
+"""
+def _find_venv_exe(venv_path: str, name: str) -> Optional[str]:
+    venv_path = os.path.abspath(venv_path)
+    key = (venv_path, name)
+    hit = _VENV_EXE_CACHE.get(key)
+    if hit is not None:
+        return hit
+    exe = Path(venv_path, _VENV_BIN_DIR, name + _EXE_SUFFIX)
+    if not exe.is_file():
+        return None
+    _VENV_EXE_CACHE[key] = str(exe)
+    return str(exe)
+
+
+"""
+@brief Forget cached executables of a virtual environment. 가상 환경의 캐시된 실행 파일 경로를 지웁니다.
+@param venv_path    Path to virtual environment 가상 환경 경로
+"""
+def _forget_venv_exes(venv_path: str) -> None:
+    venv_path = os.path.abspath(venv_path)
+    for key in [k for k in _VENV_EXE_CACHE if k[0] == venv_path]:
+        del _VENV_EXE_CACHE[key]
+    for key in [k for k in _VENV_PYI_ENSURED if k[0] == venv_path]:
+        _VENV_PYI_ENSURED.discard(key)
+    for key in [k for k in _VENV_PKG_VERSION_CACHE if k[0] == venv_path]:
+        del _VENV_PKG_VERSION_CACHE[key]
+    _VENV_SITE_CACHE.pop(venv_path, None)
+
+
+"""
+@brief Locate the site-packages directory of a virtual environment, caching hits. 가상 환경의 site-packages 디렉토리를 찾고 결과를 캐시합니다.
+@param venv_path    Path to virtual environment 가상 환경 경로
+@return Path to site-packages or None if not found site-packages 경로 또는 None
+"""
+def _find_venv_site_packages(venv_path: str) -> Optional[str]:
+    venv_path = os.path.abspath(venv_path)
+    hit = _VENV_SITE_CACHE.get(venv_path)
+    if hit is not None:
+        return hit
+    if _IS_WIN:
+        found = [os.path.join(venv_path, 'Lib', 'site-packages')]
+    else:
+        found = glob.glob(os.path.join(venv_path, 'lib', 'python*', 'site-packages'))
+    if not found or not os.path.isdir(found[0]):
+        return None
+    _VENV_SITE_CACHE[venv_path] = found[0]
+    return found[0]
+
+
 
 """
 @brief  Create a Python virtual environment. 파이썬 가상 환경을 생성합니다.
@@ -48,8 +125,8 @@ def create_venv(
         
         # Remove existing venv if clear is True
         if os.path.exists(venv_path) and clear:
-            import shutil
             shutil.rmtree(venv_path)
+            _forget_venv_exes(venv_path)
         
         # Build command
         if python_executable:
@@ -94,8 +171,8 @@ def delete_venv(venv_path: str) -> Tuple[bool, str]:
         if not is_venv(venv_path):
             return False, f"Path {venv_path} does not appear to be a virtual environment"
         
-        import shutil
         shutil.rmtree(venv_path)
+        _forget_venv_exes(venv_path)
         
         return True, f"Virtual environment deleted successfully from {venv_path}"
         
@@ -116,18 +193,11 @@ def is_venv(path: str) -> bool:
         if not os.path.exists(path):
             return False
         
-        # Check for common venv markers
-        if sys.platform == 'win32':
-            python_exe = os.path.join(path, 'Scripts', 'python.exe')
-            activate_script = os.path.join(path, 'Scripts', 'activate.bat')
-        else:
-            python_exe = os.path.join(path, 'bin', 'python')
-            activate_script = os.path.join(path, 'bin', 'activate')
-        
-        pyvenv_cfg = os.path.join(path, 'pyvenv.cfg')
-        
-        return (os.path.exists(python_exe) or os.path.exists(activate_script) 
-                or os.path.exists(pyvenv_cfg))
+        # Check for common venv markers, pyvenv.cfg first (written by every venv), python via the cached lookup
+        if os.path.exists(os.path.join(path, 'pyvenv.cfg')) or _find_venv_exe(path, 'python'):
+            return True
+        activate_script = os.path.join(path, _VENV_BIN_DIR, 'activate.bat' if _IS_WIN else 'activate')
+        return os.path.exists(activate_script)
         
     except Exception:
         return False
@@ -140,18 +210,7 @@ def is_venv(path: str) -> bool:
 """
 def get_venv_python(venv_path: str) -> Optional[str]:
     try:
-        venv_path = os.path.abspath(venv_path)
-        
-        if sys.platform == 'win32':
-            python_exe = os.path.join(venv_path, 'Scripts', 'python.exe')
-        else:
-            python_exe = os.path.join(venv_path, 'bin', 'python')
-        
-        if os.path.exists(python_exe):
-            return python_exe
-        
-        return None
-        
+        return _find_venv_exe(venv_path, 'python')
     except Exception:
         return None
 
@@ -163,18 +222,19 @@ def get_venv_python(venv_path: str) -> Optional[str]:
 """
 def get_venv_pip(venv_path: str) -> Optional[str]:
     try:
-        venv_path = os.path.abspath(venv_path)
-        
-        if sys.platform == 'win32':
-            pip_exe = os.path.join(venv_path, 'Scripts', 'pip.exe')
-        else:
-            pip_exe = os.path.join(venv_path, 'bin', 'pip')
-        
-        if os.path.exists(pip_exe):
-            return pip_exe
-        
+        return _find_venv_exe(venv_path, 'pip')
+    except Exception:
         return None
-        
+
+
+"""
+@brief Get the PyInstaller executable path for a virtual environment. 가상 환경의 PyInstaller 실행 파일 경로를 가져옵니다.
+@param venv_path    Path to virtual environment 가상 환경 경로
+@return Path to PyInstaller executable or None if not found PyInstaller 실행 파일 경로 또는 None
+"""
+def get_venv_pyinstaller(venv_path: str) -> Optional[str]:
+    try:
+        return _find_venv_exe(venv_path, 'pyinstaller')
     except Exception:
         return None
 
@@ -251,6 +311,9 @@ def uninstall_package(venv_path: str, package_name: str,
         cmd_ret: CmdSystem.Result = CmdSystem.run(cmd)
         if cmd_ret.is_error():
             raise Exception(cmd_ret.stderr)        
+        if package_name.lower() == 'pyinstaller':
+            venv_abs = os.path.abspath(venv_path)
+            _VENV_PYI_ENSURED.difference_update([k for k in _VENV_PYI_ENSURED if k[0] == venv_abs])
         return True, f"Package uninstalled successfully: {cmd_ret.stdout}"
     except Exception as e:
         JLogger().log_error(f"Unexpected error uninstalling package: {str(e)}")
@@ -346,6 +409,73 @@ def get_package_info(venv_path: str, package_name: str) -> Tuple[bool, Dict[str,
         return False, {}
 
 
+"""
+@brief Get the installed version of a package in a virtual environment without running pip. pip 실행 없이 가상 환경에 설치된 패키지 버전을 가져옵니다.
+@param venv_path        Path to virtual environment 가상 환경 경로
+@param package_name     Distribution name of package 패키지 배포 이름
+@return Version string or None if not installed 버전 문자열, 설치되지 않았으면 None
+"""
+def get_package_version(venv_path: str, package_name: str) -> Optional[str]:
+    return get_package_versions(venv_path, [package_name]).get(package_name)
+
+
+"""
+@brief Get the installed versions of several packages in a virtual environment with at most one probe. 가상 환경에 설치된 여러 패키지 버전을 최대 한 번의 프로세스 실행으로 가져옵니다.
+@param venv_path        Path to virtual environment 가상 환경 경로
+@param package_names    Distribution names of packages 패키지 배포 이름 목록
+@return Dictionary of package name to version or None if not installed 패키지 이름별 버전 딕셔너리, 설치되지 않았으면 None
+"""
+def get_package_versions(venv_path: str, package_names: List[str]) -> Dict[str, Optional[str]]:
+    versions: Dict[str, Optional[str]] = dict.fromkeys(package_names)
+    try:
+        python_exe = get_venv_python(venv_path)
+        if not python_exe:
+            return versions
+        
+        # Running inside this venv: read metadata in-process
+        if os.path.abspath(sys.prefix) == os.path.abspath(venv_path):
+            for name in package_names:
+                try:
+                    versions[name] = importlib.metadata.version(name)
+                except importlib.metadata.PackageNotFoundError:
+                    pass
+            return versions
+        
+        # Foreign interpreter: reuse the last probe while site-packages is unchanged (one stat)
+        venv_key = os.path.abspath(venv_path)
+        site_packages = _find_venv_site_packages(venv_path)
+        mtime = os.stat(site_packages).st_mtime_ns if site_packages else None
+        missing = []
+        for name in package_names:
+            hit = _VENV_PKG_VERSION_CACHE.get((venv_key, name.lower()))
+            if hit is not None and mtime is not None and hit[0] == mtime:
+                versions[name] = hit[1]
+            else:
+                missing.append(name)
+        if not missing:
+            return versions
+        
+        # One plain 'python -c' for every cache miss, far faster than a 'pip show' per package
+        probe = (
+            'import sys, json, importlib.metadata as m\n'
+            'v = {}\n'
+            'for n in sys.argv[1:]:\n'
+            '    try: v[n] = m.version(n)\n'
+            '    except m.PackageNotFoundError: v[n] = None\n'
+            'print(json.dumps(v))'
+        )
+        cmd_ret: CmdSystem.Result = CmdSystem.run([python_exe, '-c', probe, *missing], raise_err=False)
+        if not cmd_ret.is_success():
+            return versions
+        for name, version in json.loads(cmd_ret.stdout).items():
+            versions[name] = version
+            if mtime is not None:
+                _VENV_PKG_VERSION_CACHE[(venv_key, name.lower())] = (mtime, version)
+        return versions
+    except Exception:
+        return versions
+
+
 """
 @brief Export installed packages to a requirements.txt file. 설치된 패키지를 requirements.txt 파일로 내보냅니다.
 @param venv_path    Path to virtual environment 가상 환경 경로
@@ -422,6 +552,7 @@ def get_venv_info(venv_path: str) -> Dict[str, str]:
             'is_venv': is_venv(venv_path),
             'python': get_venv_python(venv_path),
             'pip': get_venv_pip(venv_path),
+            'pyinstaller': get_venv_pyinstaller(venv_path),
         }
         
         # Read pyvenv.cfg if available
@@ -454,14 +585,26 @@ def venv_paths(venv_path: str) -> Tuple[Optional[str], Optional[str]]:
         return None, None
 
 
+"""
+@brief Resolve the build tool executables of a virtual environment in one call. 가상 환경의 빌드 도구 실행 파일 경로를 한 번에 가져옵니다.
+@param venv_path    Path to virtual environment 가상 환경 경로
+@return Dictionary of tool name to path or None ('python', 'pip', 'pyinstaller', 'pyi-makespec') 도구 이름별 경로 딕셔너리
+"""
+def venv_tools(venv_path: str) -> Dict[str, Optional[str]]:
+    return {name: _find_venv_exe(venv_path, name) for name in ('python', 'pip', 'pyinstaller', 'pyi-makespec')}
+
+
 """
 @brief Install requirements from a requirements.txt file. requirements.txt 파일에서 의존성을 설치합니다.
 @param venv_path        Path to virtual environment 가상 환경 경로
 @param requirements_file    Path to requirements.txt file requirements.txt 파일 경로
+@param pip_cache_dir    pip wheel cache directory, None keeps pip's per-user default pip 휠 캐시 디렉토리, None이면 pip 기본값
+@param extra_packages   Additional requirements (e.g., ['pyinstaller']) resolved in the same pip run 같은 pip 실행에서 함께 해석할 추가 패키지 (예: ['pyinstaller'])
 @return Tuple of (success: bool, message: str) (성공 여부, 메시지) 튜플
 @throws VenvError: If requirements installation fails requirements 설치 실패 시
 """
-def install_requirements(venv_path: str, requirements_file: str) -> Tuple[bool, str]:
+def install_requirements(venv_path: str, requirements_file: str, pip_cache_dir: Optional[str] = None,
+                         extra_packages: Optional[List[str]] = None) -> Tuple[bool, str]:
     try:
         if not os.path.exists(requirements_file):
             return False, f"Requirements file not found: {requirements_file}"
@@ -471,7 +614,13 @@ def install_requirements(venv_path: str, requirements_file: str) -> Tuple[bool,
         if not pip_exe:
             raise VenvError(f"pip not found in virtual environment at {venv_path}")
         
-        cmd = [pip_exe, 'install', '-r', requirements_file]
+        # Prefer wheels over sdist builds; an explicit cache dir lets CI restore downloads between runs
+        cmd = [pip_exe, 'install', '--prefer-binary', '-r', requirements_file]
+        if pip_cache_dir:
+            cmd += ['--cache-dir', pip_cache_dir]
+        # One resolver pass for the file and the extras, instead of a second pip start per package
+        if extra_packages:
+            cmd += extra_packages
         
         cmd_ret: CmdSystem.Result = CmdSystem.run(cmd)
         if cmd_ret.is_error():
@@ -490,7 +639,22 @@ def install_requirements(venv_path: str, requirements_file: str) -> Tuple[bool,
 """
 def ensure_pyinstaller(venv_path: str, version: Optional[str] = None) -> Tuple[bool, str]:
     try:
-        pip_exe = get_venv_pip(venv_path)
+        ensured_key = (os.path.abspath(venv_path), version)
+        if ensured_key in _VENV_PYI_ENSURED:
+            return True, "PyInstaller already ensured in virtual environment"
+        
+        # One cached lookup for both scripts; an unpinned request is satisfied by the pyinstaller script alone
+        tools = venv_tools(venv_path)
+        if version is None and tools['pyinstaller']:
+            _VENV_PYI_ENSURED.add(ensured_key)
+            return True, "PyInstaller already installed in virtual environment"
+        
+        installed = get_package_version(venv_path, 'pyinstaller')
+        if installed and (version is None or installed == version):
+            _VENV_PYI_ENSURED.add(ensured_key)
+            return True, f"PyInstaller {installed} already installed in virtual environment"
+        
+        pip_exe = tools['pip']
         
         if not pip_exe:
             raise VenvError(f"pip not found in virtual environment at {venv_path}")
@@ -502,10 +666,12 @@ def ensure_pyinstaller(venv_path: str, version: Optional[str] = None) -> Tuple[b
         else:
             cmd.append('pyinstaller')
         
-        cmd_ret: CmdSystem.Result = CmdSystem.run(cmd)
+        # pip's progress output is not needed, only the stderr tail of a failure is kept
+        cmd_ret: CmdSystem.Result = CmdSystem.run(cmd, quiet=True)
         if cmd_ret.is_error():
             raise Exception(cmd_ret.stderr)
-        return True, f"PyInstaller ensured in virtual environment: {cmd_ret.stdout}"
+        _VENV_PYI_ENSURED.add(ensured_key)
+        return True, "PyInstaller ensured in virtual environment"
     except Exception as e:
         JLogger().log_error(f"Unexpected error ensuring PyInstaller: {str(e)}")
         return False, f"Unexpected error ensuring PyInstaller: {str(e)}"
@@ -525,24 +691,24 @@ def clean_build_dirs(build_dir: str = 'build',
                     preserve_dist: bool = True
     ) -> Tuple[bool, str]:
     try:
-        import shutil
         removed = []
-        
-        # Remove build directory
-        if os.path.exists(build_dir):
-            shutil.rmtree(build_dir)
-            removed.append(build_dir)
-        
-        # Remove __pycache__ directory
-        if os.path.exists(pycache_dir):
-            shutil.rmtree(pycache_dir)
-            removed.append(pycache_dir)
-        
-        # Optionally remove dist directory
-        if not preserve_dist and os.path.exists(dist_dir):
-            shutil.rmtree(dist_dir)
-            removed.append(dist_dir)
-        
+        failed = []
+        
+        # Remove build, __pycache__ and optionally dist directories concurrently (EAFP, no exists() pre-check)
+        targets = (build_dir, pycache_dir) if preserve_dist else (build_dir, pycache_dir, dist_dir)
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            jobs = [(target, pool.submit(FileSystem.rmtree_fast, target)) for target in targets]
+            for target, job in jobs:
+                try:
+                    job.result()
+                    removed.append(target)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    failed.append(f"{target} ({e})")
+        
+        if failed:
+            return False, f"Failed to clean build directories: {', '.join(failed)}"
         if removed:
             return True, f"Removed directories: {', '.join(removed)}"
         else:
@@ -57,9 +57,7 @@ def download_file(
 @return	Dictionary with URL components (scheme, netloc, path, params, query, fragment) URL 구성 요소를 담은 딕셔너리 (scheme, netloc, path, params, query, fragment)
 """
 def parse_url(url: str) -> Dict[str, str]:
-    from urllib.parse import urlparse
-    
-    parsed = urlparse(url)
+    parsed = urllib.parse.urlparse(url)
     return {
         'scheme': parsed.scheme,
         'netloc': parsed.netloc,
@@ -89,15 +87,12 @@ def build_url(base_url: str, params: Dict[str, str]) -> str:
 @return	List of URLs found in HTML HTML에서 발견된 URL 리스트
 """
 def extract_links(html: str, base_url: Optional[str] = None) -> List[str]:
-    import re
-    from urllib.parse import urljoin
-    
     # Find all href attributes
     pattern = r'href=["\']([^"\']+)["\']'
     links = re.findall(pattern, html)
     
     if base_url:
-        links = [urljoin(base_url, link) for link in links]
+        links = [urllib.parse.urljoin(base_url, link) for link in links]
     
     return links
 
@@ -108,8 +103,6 @@ def extract_links(html: str, base_url: Optional[str] = None) -> List[str]:
 @return	Plain text content 순수 텍스트 콘텐츠
 """
 def extract_text_from_html(html: str) -> str:
-    import re
-    
     # Remove script and style elements
     text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
     text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
@@ -130,8 +123,6 @@ def extract_text_from_html(html: str) -> str:
 @return	Element HTML or None if not found 요소 HTML, 찾을 수 없으면 None
 """
 def get_html_element_by_id(html: str, element_id: str) -> Optional[str]:
-    import re
-    
     pattern = rf'<[^>]+id=["\']?{re.escape(element_id)}["\']?[^>]*>.*?</[^>]+>'
     match = re.search(pattern, html, re.DOTALL | re.IGNORECASE)
     
@@ -145,8 +136,6 @@ def get_html_element_by_id(html: str, element_id: str) -> Optional[str]:
 @return	List of matching element HTML 일치하는 요소 HTML 리스트
 """
 def get_html_elements_by_class(html: str, class_name: str) -> List[str]:
-    import re
-    
     pattern = rf'<[^>]+class=["\']?[^"\']*{re.escape(class_name)}[^"\']*["\']?[^>]*>.*?</[^>]+>'
     matches = re.findall(pattern, html, re.DOTALL | re.IGNORECASE)
     